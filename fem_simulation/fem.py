@@ -1,4 +1,5 @@
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import getLogger
 from dataclasses import dataclass, asdict
 import ngsolve as ng
@@ -21,6 +22,21 @@ class SimulationParameters:
     maxit: int = 100
     maxerr: float = 1e-11
     dampfactor: int = 1  # ダンピング係数: 1 -> ダンピングなし
+    inverse: str = "auto"
+    # NOTE: Newton 内の線形ソルバ. "auto" -> PARDISO が使えれば pardiso, なければ sparsecholesky
+    realcompile: bool = False
+    # NOTE: true で弱形式の被積分関数を C++ にコンパイルする (C++ コンパイラが必要, 初回はコンパイル待ちが入る).
+    #   失敗した場合は ngsolve 内部のコンパイルにフォールバックする
+    max_step_halvings: int = 4
+    # NOTE: 連続法で Newton が収束しない場合に Vtip の刻みを半分にする最大回数.
+    #   これを超えた場合は homotopy 法にフォールバックする
+    export_toml: bool = True
+    # NOTE: params.json に加えて人が読むための params.toml も出力するか
+
+    def __post_init__(self):
+        if self.inverse == "auto":
+            self.inverse = _default_inverse()
+        logger.info(f"Using linear solver: {self.inverse}")
 
 
 def run_fem(
@@ -30,72 +46,148 @@ def run_fem(
     siml: SimulationParameters,
     out_dir: Path,
 ):
+    regions = _create_mesh_regions(mesh, geom)
     V = ng.H1(mesh, order=1)  # 関数空間
+    # Dirichlet 境界 (ground, tip) 以外の自由度. Vtip によらないので一度だけ計算
+    freedofs = V.FreeDofs()
+    freedofs &= ~V.GetDofs(regions.ground)
+    freedofs &= ~V.GetDofs(regions.tip)
     u = ng.GridFunction(V, name="electrostatic_potential")  # 解 (静電ポテンシャル)
 
     # ホモトピー変数: 0 -> 初期問題, 1 -> 本来の問題
     hmtp_charge = ng.Parameter(0.0)  # 電荷密度 (非線形項)
     hmtp_sigma = ng.Parameter(0.0)  # 界面電荷密度
 
-    a = _setup_weak_form(mesh, V, phys, geom, hmtp_charge, hmtp_sigma)
-
-    out_dir.mkdir(parents=True, exist_ok=True)
+    a = _setup_weak_form(
+        V, phys, geom, regions, hmtp_charge, hmtp_sigma, siml.realcompile
+    )
+    a.Assemble()  # 行列の確保は一度だけ (以降は Newton 内で線形化を再組立て)
+    probes = _create_line_probes(mesh, geom)
 
-    # Vtip_list を分割・ソート
-    vtip_set = set(siml.Vtip_list)
-    has_zero = 0.0 in vtip_set
+    if not out_dir.exists():
+        out_dir.mkdir(parents=True)
 
-    vtip_array = np.array(siml.Vtip_list)
-    positive = np.sort(vtip_array[vtip_array > 0])  # 正、昇順
-    negative = np.sort(vtip_array[vtip_array < 0])[::-1]  # 負、降順 (0に近い順)
+    # Vtip_list を重複除去・ソート (np.unique) してから分割
+    vtip_sorted = np.unique(np.asarray(siml.Vtip_list, dtype=np.float64))
+    has_zero = bool(np.any(vtip_sorted == 0.0))
+    positive = vtip_sorted[vtip_sorted > 0]  # 正、昇順
+    negative = vtip_sorted[vtip_sorted < 0][::-1]  # 負、降順 (0に近い順)
 
-    total = len(siml.Vtip_list)
+    total = len(vtip_sorted)
     solved = 0
 
-    def solve_and_save(Vtip: float, save: bool):
-        nonlocal solved
-        # 境界条件設定
-        u.Set(ng.CoefficientFunction(0.0), definedon=mesh.Boundaries(geom.bc_ground))
+    # 書き出しは 1 スレッドで行い, 次の Vtip の計算と重ねる
+    io_pool = ThreadPoolExecutor(max_workers=1)
+    saves: list[Future] = []
+
+    Vtip_current: float | None = None  # 直前に解いた Vtip (連続法の始点)
+    u_prev = u.vec.CreateVector()
+
+    def set_tip(Vtip: float):
         u.Set(
             ng.CoefficientFunction(Vtip / phys.kT),
-            definedon=mesh.Boundaries(geom.bc_tip),
+            definedon=regions.tip,
         )
+
+    def solve(Vtip: float):
+        nonlocal Vtip_current
+        if Vtip_current is None:
+            # 初期状態: 継続元がないので直接解き, 必要なら homotopy 法
+            set_tip(Vtip)
+            if not _solve_newton(siml, a, u, freedofs, hmtp_charge, hmtp_sigma):
+                _solve_homotopy(siml, a, u, freedofs, hmtp_charge, hmtp_sigma)
+            Vtip_current = Vtip
+            return
+
+        # 適応ステップ幅の連続法: 収束しなければ刻みを半分にしてやり直す
+        dV = Vtip - Vtip_current
+        n_halvings = 0
+        while Vtip_current != Vtip:
+            remaining = Vtip - Vtip_current
+            V_next = Vtip if abs(dV) >= abs(remaining) else Vtip_current + dV
+            u_prev.data = u.vec
+            set_tip(V_next)
+            if _solve_newton(siml, a, u, freedofs, hmtp_charge, hmtp_sigma):
+                Vtip_current = V_next
+                dV *= 2
+                continue
+
+            u.vec.data = u_prev
+            n_halvings += 1
+            if n_halvings > siml.max_step_halvings:
+                set_tip(Vtip)
+                _solve_homotopy(siml, a, u, freedofs, hmtp_charge, hmtp_sigma)
+                Vtip_current = Vtip
+                break
+            dV /= 2
+            logger.warning(
+                f"Newton solver did not converge at Vtip = {V_next:.3f} V, "
+                f"retrying with step {dV:.3f} V"
+            )
+
+    def solve_and_save(Vtip: float, save: bool):
+        nonlocal solved
         # Newton 法
-        _solve_newton(mesh, geom, siml, a, u, V, hmtp_charge, hmtp_sigma)
+        solve(Vtip)
         # 保存
         if save:
             solved += 1
             logger.info(f"Solved Vtip = {Vtip:.2f} V ({solved}/{total})")
             dir_path = out_dir / f"Vtip_{Vtip:.2f}V"
-            dir_path.mkdir(parents=True, exist_ok=True)
-            _save_potential(mesh, u, phys, geom, dir_path)
-
-    # 1. まず 0.0V を解く (初期値)
-    logger.info("Solving initial state at Vtip = 0.00 V")
-    solve_and_save(0.0, save=has_zero)
-
-    # 2. 0.0V の解を保存 (負の電圧処理前に復元するため)
-    u_zero = u.vec.CreateVector()
-    u_zero.data = u.vec
+            saves.append(_save_potential(u, phys, geom, probes, dir_path, io_pool))
 
-    # 3. 正の電圧を処理 (0.0V の解から継続)
-    for Vtip in positive:
-        logger.info(f"Solving for tip voltage Vtip = {Vtip:.2f} V")
-        solve_and_save(float(Vtip), save=True)
+    try:
+        # 接地境界条件は Vtip によらず 0 で, Newton でも変更されないので一度だけ設定
+        u.Set(ng.CoefficientFunction(0.0), definedon=regions.ground)
+
+        # 1. まず 0.0V を解く (初期値)
+        logger.info("Solving initial state at Vtip = 0.00 V")
+        solve_and_save(0.0, save=has_zero)
+
+        # 2. 0.0V の解を保存 (負の電圧処理前に復元するため)
+        u_zero = u.vec.CreateVector()
+        u_zero.data = u.vec
+
+        # 3. 正の電圧を処理 (0.0V の解から継続)
+        for Vtip in positive:
+            logger.info(f"Solving for tip voltage Vtip = {Vtip:.2f} V")
+            solve_and_save(float(Vtip), save=True)
+
+        # 4. 0.0V の解に戻す
+        if len(negative) > 0:
+            logger.info("Restoring solution at Vtip = 0.00 V for negative voltages")
+            u.vec.data = u_zero
+            Vtip_current = 0.0
+
+        # 5. 負の電圧を処理 (0.0V の解から継続)
+        for Vtip in negative:
+            logger.info(f"Solving for tip voltage Vtip = {Vtip:.2f} V")
+            solve_and_save(float(Vtip), save=True)
+    finally:
+        io_pool.shutdown(wait=True)
+    for future in saves:
+        future.result()  # 書き出し中の例外を送出
+
+
+def _default_inverse() -> str:
+    # PARDISO (MKL) はマルチスレッドで sparsecholesky より高速
+    try:
+        from ngsolve.config import USE_PARDISO
+    except ImportError:
+        return "sparsecholesky"
+    return "pardiso" if USE_PARDISO else "sparsecholesky"
 
-    # 4. 0.0V の解に戻す
-    if len(negative) > 0:
-        logger.info("Restoring solution at Vtip = 0.00 V for negative voltages")
-        u.vec.data = u_zero
 
-    # 5. 負の電圧を処理 (0.0V の解から継続)
-    for Vtip in negative:
-        logger.info(f"Solving for tip voltage Vtip = {Vtip:.2f} V")
-        solve_and_save(float(Vtip), save=True)
+def _clamp(val, bound, knee=0.9):
+    # |val| <= knee * bound では恒等, その外側は ±bound に滑らかに飽和 (C^1 連続)
+    k = knee * bound
+    w = bound - k
 
+    def _tail(y):
+        t = (y - k) / w
+        return k + w * t / ng.sqrt(1 + t * t)
 
-def _clamp(val, bound):
-    return ng.IfPos(val - bound, bound, ng.IfPos(-bound - val, -bound, val))
+    return ng.IfPos(val - k, _tail(val), ng.IfPos(-k - val, -_tail(-val), val))
 
 
 def _safe_exp(x):
@@ -103,42 +195,78 @@ def _safe_exp(x):
     return ng.exp(x_clip)
 
 
+def _compile(cf: ng.CoefficientFunction, realcompile: bool) -> ng.CoefficientFunction:
+    if realcompile:
+        try:
+            return cf.Compile(realcompile=True, wait=True)
+        except Exception as e:
+            logger.warning(f"realcompile failed ({e}), using ngsolve Compile instead")
+    return cf.Compile()
+
+
+def _weighted_sum(weights: list[float], terms: list) -> ng.CoefficientFunction:
+    if len(terms) == 0:
+        return ng.CoefficientFunction(0.0)
+    if len(terms) == 1:
+        return weights[0] * terms[0]
+    return ng.InnerProduct(
+        ng.CoefficientFunction(tuple(weights)), ng.CoefficientFunction(tuple(terms))
+    )
+
+
+@dataclass
+class MeshRegions:
+    """境界・領域の Region (名前の解決と要素の走査を一度だけ行う)"""
+
+    ground: ng.Region
+    tip: ng.Region
+    far: ng.Region
+    intf: ng.Region
+    sem: ng.Region
+
+
+def _create_mesh_regions(mesh: ng.Mesh, geom: GeometricParameters) -> MeshRegions:
+    return MeshRegions(
+        ground=mesh.Boundaries(geom.bc_ground),
+        tip=mesh.Boundaries(geom.bc_tip),
+        far=mesh.Boundaries(geom.bc_far),
+        intf=mesh.Boundaries(geom.bc_intf),
+        sem=mesh.Materials(geom.sem_name),
+    )
+
+
 def _setup_weak_form(
-    mesh: ng.Mesh,
     V: ng.H1,
     phys: PhysicalParameters,
     geom: GeometricParameters,
+    regions: MeshRegions,
     hmtp_charge: ng.Parameter,
     hmtp_sigma: ng.Parameter,
+    realcompile: bool = False,
 ) -> ng.BilinearForm:
     uh, vh = V.TnT()
+    # NOTE: スカラー係数は CoefficientFunction にする前に float にまとめ, 式木のノードを減らす
     c = (const.e * geom.Lc**2) / (const.epsilon_0 * phys.kT)
     u_clip = _clamp(uh, 120.0)
 
-    n = c * phys.Nc * F_half_aymerich_humet_ng((phys.Ef - phys.Eg) / phys.kT + u_clip)
-    p = c * phys.Nv * F_half_aymerich_humet_ng((-phys.Ef) / phys.kT - u_clip)
-
-    Ndp = ng.CoefficientFunction(0.0)
-    sum_ratios_d = sum(phys.donor_ratios)
-    for Ed, ratio in zip(phys.Ed, phys.donor_ratios):
-        Ndp += ng.CoefficientFunction(
-            c
-            * phys.Nd
-            * (ratio / sum_ratios_d)
-            / (1 + 2 * _safe_exp((phys.Ef - phys.Eg + Ed) / phys.kT + u_clip))
-        )
-    Nap = ng.CoefficientFunction(0.0)
-    sum_ratios_a = sum(phys.acceptor_ratios)
-    for Ea, ratio in zip(phys.Ea, phys.acceptor_ratios):
-        Nap += ng.CoefficientFunction(
-            c
-            * phys.Na
-            * (ratio / sum_ratios_a)
-            / (1 + 4 * _safe_exp((Ea - phys.Ef) / phys.kT - u_clip))
-        )
+    n = (c * phys.Nc) * F_half_aymerich_humet_ng((phys.Ef - phys.Eg) / phys.kT + u_clip)
+    p = (c * phys.Nv) * F_half_aymerich_humet_ng((-phys.Ef) / phys.kT - u_clip)
 
-    rho = hmtp_charge * (p - n + Ndp - Nap)
-    sigma = hmtp_sigma * phys.sigma * (const.e * geom.Lc) / (const.epsilon_0 * phys.kT)
+    # 各準位の寄与を 1 つの InnerProduct ノードにまとめる
+    Ndp = _weighted_sum(
+        [c * phys.Nd * w for w in phys.donor_weights],
+        [1 / (1 + 2 * _safe_exp(shift + u_clip)) for shift in phys.donor_shifts],
+    )
+    Nap = _weighted_sum(
+        [c * phys.Na * w for w in phys.acceptor_weights],
+        [1 / (1 + 4 * _safe_exp(shift - u_clip)) for shift in phys.acceptor_shifts],
+    )
+
+    # 弱形式の符号 (-rho, -sigma) も係数側に含めておく
+    neg_rho = hmtp_charge * (n - p + Nap - Ndp)
+    neg_sigma = hmtp_sigma * (
+        -phys.sigma * (const.e * geom.Lc) / (const.epsilon_0 * phys.kT)
+    )
 
     epsilon_r = ng.CoefficientFunction(
         [phys.epsilon_sem, phys.epsilon_ox, phys.epsilon_vac]
@@ -147,65 +275,51 @@ def _setup_weak_form(
     # robin boundary condition coeffs
     robin_coeff = 1 / (geom.l_radius * 1e-9 / geom.Lc)
     a = ng.BilinearForm(V)
-    a += epsilon_r * ng.grad(uh) * ng.grad(vh) * ng.x * ng.dx
-    a += epsilon_r * robin_coeff * uh * vh * ng.x * ng.ds(geom.bc_far)
-    a += -rho * vh * ng.x * ng.dx(definedon=mesh.Materials(geom.sem_name))
-    a += -sigma * vh * ng.x * ng.ds(geom.bc_intf)
-
+    a += _compile(epsilon_r * ng.grad(uh) * ng.grad(vh) * ng.x, realcompile) * ng.dx
+    a += _compile(epsilon_r * robin_coeff * uh * vh * ng.x, realcompile) * ng.ds(
+        definedon=regions.far
+    )
+    a += _compile(neg_rho * vh * ng.x, realcompile) * ng.dx(definedon=regions.sem)
+    a += _compile(neg_sigma * vh * ng.x, realcompile) * ng.ds(definedon=regions.intf)
     return a
 
 
 def _solve_newton(
-    mesh: ng.Mesh,
-    geom: GeometricParameters,
     siml: SimulationParameters,
     a: ng.BilinearForm,
     u: ng.GridFunction,
-    V: ng.H1,
+    freedofs: ng.BitArray,
     hmtp_charge: ng.Parameter,
     hmtp_sigma: ng.Parameter,
-):
+) -> bool:
     hmtp_charge.Set(1.0)
     hmtp_sigma.Set(1.0)
 
-    freedofs = V.FreeDofs()
-    freedofs &= ~V.GetDofs(mesh.Boundaries(geom.bc_ground))
-    freedofs &= ~V.GetDofs(mesh.Boundaries(geom.bc_tip))
-
-    a.Assemble()
-
     logger.info("Starting Newton solver...")
-    converged, iter = ng.solvers.Newton(
-        a,
-        u,
-        freedofs,
-        maxit=siml.maxit,
-        maxerr=siml.maxerr,
-        inverse="sparsecholesky",
-        dampfactor=siml.dampfactor,
-        printing=False,
-    )
+    converged, iter = _newton(siml, a, u, freedofs)
     if converged >= 0:
         logger.info(f"Newton solver converged in {iter} iterations.")
-        return
+        return True
+    return False
+
 
+def _solve_homotopy(
+    siml: SimulationParameters,
+    a: ng.BilinearForm,
+    u: ng.GridFunction,
+    freedofs: ng.BitArray,
+    hmtp_charge: ng.Parameter,
+    hmtp_sigma: ng.Parameter,
+):
     # 収束しない場合は homotopy 法で非線形項を徐々に導入
     logger.warning("Newton solver did not converge, using homotopy method...")
     n_hmtp_steps = 10
+    inv = None  # Jacobian の分解はステップ間で使い回す
     for step in range(n_hmtp_steps + 1):
         hmtp_value = step / n_hmtp_steps
         hmtp_charge.Set(hmtp_value)
         hmtp_sigma.Set(hmtp_value)
-        converged, iter = ng.solvers.Newton(
-            a,
-            u,
-            freedofs,
-            maxit=siml.maxit,
-            maxerr=siml.maxerr,
-            inverse="sparsecholesky",
-            dampfactor=siml.dampfactor,
-            printing=False,
-        )
+        converged, iter, inv = _newton_reuse(siml, a, u, freedofs, inv)
         if converged >= 0:
             logger.info(
                 f"  homotopy step {step+1}/{n_hmtp_steps} converged in {iter} iterations."
@@ -216,15 +330,133 @@ def _solve_newton(
     logger.info("Newton solver converged with homotopy method.")
 
 
+def _newton(
+    siml: SimulationParameters,
+    a: ng.BilinearForm,
+    u: ng.GridFunction,
+    freedofs: ng.BitArray,
+) -> tuple[int, int]:
+    # TaskManager: 線形化の組立てを要素ごとに並列化
+    with ng.TaskManager():
+        return ng.solvers.Newton(
+            a,
+            u,
+            freedofs,
+            maxit=siml.maxit,
+            maxerr=siml.maxerr,
+            inverse=siml.inverse,
+            dampfactor=siml.dampfactor,
+            printing=False,
+        )
+
+
+def _newton_reuse(
+    siml: SimulationParameters,
+    a: ng.BilinearForm,
+    u: ng.GridFunction,
+    freedofs: ng.BitArray,
+    inv=None,
+):
+    # Shamanskii 型 Newton 法: 与えられた (古い) 分解 inv をそのまま使い,
+    # 残差の減少率が悪化した (> 0.5) ときだけ線形化を組立て直して再分解する
+    res = u.vec.CreateVector()
+    du = u.vec.CreateVector()
+
+    def factorize():
+        a.AssembleLinearization(u.vec)
+        return a.mat.Inverse(freedofs, inverse=siml.inverse)
+
+    err_prev = None
+    with ng.TaskManager():
+        for it in range(1, siml.maxit + 1):
+            a.Apply(u.vec, res)
+            fresh = inv is None
+            if fresh:
+                inv = factorize()
+            du.data = inv * res
+            err = np.sqrt(abs(ng.InnerProduct(du, res)))
+            if not fresh and err_prev is not None and err > 0.5 * err_prev:
+                inv = factorize()
+                du.data = inv * res
+                err = np.sqrt(abs(ng.InnerProduct(du, res)))
+            u.vec.data -= siml.dampfactor * du
+            if err < siml.maxerr:
+                return 0, it, inv
+            err_prev = err
+    return -1, siml.maxit, inv
+
+
+@dataclass
+class LineProbes:
+    """ラインプロファイルの評価点 (u に依存しないので Vtip 間で再利用する)"""
+
+    interface_r: np.ndarray  # 界面上の r 座標 (無次元)
+    interface_points: np.ndarray | list  # 対応する MeshPoint
+    axis_z: np.ndarray  # 軸上の z 座標 (無次元)
+    axis_points: np.ndarray | list
+
+
+def _create_line_probes(
+    mesh: ng.Mesh, geom: GeometricParameters, n_points=500
+) -> LineProbes:
+    # NOTE: メッシュ座標は Lc で無次元化されているため、座標を Lc で割る必要がある
+    r_dimless = np.linspace(
+        0, geom.l_radius / geom.Lc, n_points + 1, endpoint=True, dtype=np.float64
+    )
+    interface_points, interface_mask = _locate_points(
+        mesh, r_dimless, np.full_like(r_dimless, -geom.l_ox / geom.Lc)
+    )
+
+    z_dimless = np.linspace(
+        -(geom.l_ox + geom.l_sem) / geom.Lc,
+        geom.tip_sample_distance / geom.Lc,
+        n_points + 1,
+        endpoint=True,
+        dtype=np.float64,
+    )
+    axis_points, axis_mask = _locate_points(
+        mesh, np.full_like(z_dimless, 0.0), z_dimless
+    )
+
+    return LineProbes(
+        interface_r=r_dimless[interface_mask],
+        interface_points=interface_points,
+        axis_z=z_dimless[axis_mask],
+        axis_points=axis_points,
+    )
+
+
 def _save_potential(
-    mesh: ng.Mesh,
     u: ng.GridFunction,
     phys: PhysicalParameters,
     geom: GeometricParameters,
+    probes: LineProbes,
     dir_path: Path,
-    n_points=500,
+    io_pool: ThreadPoolExecutor,
+) -> Future:
+    # u は次の Vtip で上書きされるため, 評価とコピーはここで行い書き出しだけ別スレッドで行う
+    u_np = u.vec.FV().NumPy().copy()
+    potential_r_interface = _valuate_potential_at_line(
+        u, probes.interface_points, phys.kT
+    )
+    potential_z_axis = _valuate_potential_at_line(u, probes.axis_points, phys.kT)
+    return io_pool.submit(
+        _write_potential,
+        dir_path,
+        u_np,
+        (probes.interface_r * geom.Lc, potential_r_interface),
+        (probes.axis_z * geom.Lc, potential_z_axis),
+    )
+
+
+def _write_potential(
+    dir_path: Path,
+    u_np: np.ndarray,
+    interface: tuple[np.ndarray, np.ndarray],
+    axis: tuple[np.ndarray, np.ndarray],
 ):
-    u_np = u.vec.FV().NumPy()
+    dir_path.mkdir(parents=True, exist_ok=True)
+
     potential_dimless_path = dir_path / "potential_dimless.npy"
     np.save(potential_dimless_path, u_np)
     logger.info(
@@ -232,68 +464,55 @@ def _save_potential(
     )
 
     # save line profiles
-    # NOTE: メッシュ座標は Lc で無次元化されているため、座標を Lc で割る必要がある
     potential_interface_path = dir_path / "potential_interface.csv"
-    r_dimless = np.linspace(0, geom.l_radius / geom.Lc, n_points + 1, endpoint=True)
-    interface_coords = np.column_stack(
-        (r_dimless, np.full_like(r_dimless, -geom.l_ox / geom.Lc))
-    )
-    valid_r_interface, potential_r_interface = _valuate_potential_at_line(
-        u, mesh, interface_coords, "horizontal", phys.kT
-    )
-    np.savetxt(
-        potential_interface_path,
-        np.column_stack((valid_r_interface * geom.Lc, potential_r_interface)),
-        header="r[m],potential[V]",
-        comments="",
-        delimiter=",",
-    )
+    _save_line_profile(potential_interface_path, "r[m],potential[V]", *interface)
     logger.info(
         f"Electrostatic potential at interface saved to {potential_interface_path}"
     )
 
     potential_axis_path = dir_path / "potential_axis.csv"
-    z_dimless = np.linspace(
-        -(geom.l_ox + geom.l_sem) / geom.Lc,
-        geom.tip_sample_distance / geom.Lc,
-        n_points + 1,
-        endpoint=True,
-    )
-    axis_coords = np.column_stack((np.full_like(z_dimless, 0.0), z_dimless))
-    valid_z_axis, potential_z_axis = _valuate_potential_at_line(
-        u, mesh, axis_coords, "vertical", phys.kT
-    )
-    np.savetxt(
-        potential_axis_path,
-        np.column_stack((valid_z_axis * geom.Lc, potential_z_axis)),
-        header="z[m],potential[V]",
-        comments="",
-        delimiter=",",
-    )
+    _save_line_profile(potential_axis_path, "z[m],potential[V]", *axis)
     logger.info(f"Electrostatic potential at axis saved to {potential_axis_path}")
 
 
-def _valuate_potential_at_line(
-    u: ng.GridFunction, msh: ng.Mesh, coords: np.ndarray, axis: str, Vc: float
+def _save_line_profile(
+    path: Path, header: str, coord: np.ndarray, potential: np.ndarray
 ):
-    r_coords = coords[:, 0]
-    z_coords = coords[:, 1]
+    # np.savetxt と同じ書式 (%.18e) だが, 行ごとの format/write を避けて一括で書き出す
+    data = np.column_stack((coord, potential)).reshape(-1)
+    body = ("%.18e,%.18e\n" * len(coord)) % tuple(data.tolist())
+    with open(path, "w") as f:
+        f.write(header + "\n" + body)
+
 
+def _locate_points(msh: ng.Mesh, r_coords: np.ndarray, z_coords: np.ndarray):
     try:
-        # ベクトル化評価
-        potential = np.array(u(msh(r_coords, z_coords))) * Vc  # type: ignore
-        valid = z_coords if axis == "vertical" else r_coords
-        return valid, potential
+        # ベクトル化探索: メッシュ外の点 (nr = -1) はマスクで除外
+        pts = msh(r_coords, z_coords)
+        mask = pts["nr"] >= 0  # type: ignore
+        return pts[mask], mask
     except Exception:
-        # フォールバック: 個別評価
-        logger.warning("Vectorized evaluation failed, falling back to loop")
-        potential = []
-        valid = []
-        for coord in coords:
+        # フォールバック: 個別探索
+        logger.warning("Vectorized point search failed, falling back to loop")
+        pts = np.empty(len(r_coords), dtype=object)
+        mask = np.zeros(len(r_coords), dtype=bool)
+        for i, (r, z) in enumerate(zip(r_coords.tolist(), z_coords.tolist())):
             try:
-                val = u(msh(coord[0], coord[1])) * Vc
-                potential.append(val)
-                valid.append(coord[1] if axis == "vertical" else coord[0])
+                mp = msh(r, z)
             except Exception:
                 continue
-        return np.array(valid), np.array(potential)
+            if mp.nr >= 0:
+                pts[i] = mp
+                mask[i] = True
+        return list(pts[mask]), mask
+
+
+def _valuate_potential_at_line(
+    u: ng.GridFunction, pts: np.ndarray | list, Vc: float
+) -> np.ndarray:
+    if isinstance(pts, np.ndarray):
+        return np.asarray(u(pts)).reshape(-1) * Vc  # type: ignore
+    potential = np.empty(len(pts), dtype=np.float64)
+    for i, mp in enumerate(pts):
+        potential[i] = u(mp)
+    return potential * Vc
@@ -1,27 +1,84 @@
+import math
 import numpy as np
 from ngsolve import sqrt, exp, IfPos
 
+try:
+    import numba
+except ImportError:  # numba が無ければ NumPy 版を使う
+    numba = None
+
 a = 9.6
 b = 2.13
 c = 2.4
 g = 2 / np.sqrt(np.pi)  # 1 / Gamma(3/2)
+k = 3 * np.sqrt(2)
 eps = 1e-8
 clip_exp = 40.0
 
 
-def F_half_aymerich_humet_np(x: np.ndarray | float) -> np.ndarray:
-    return 1.0 / (
-        3 * np.sqrt(2) * (b + x + (np.abs(x - b) ** c + a) ** (1 / c)) ** (-1.5)
-        + g * np.exp(-x)
+# NOTE: base ** (-1.5) は pow を避けて 1 / (base * sqrt(base)) で計算する
+def _F_half_aymerich_humet_np(x: np.ndarray | float) -> np.ndarray:
+    base = b + x + (np.abs(x - b) ** c + a) ** (1 / c)
+    return 1.0 / (k / (base * np.sqrt(base)) + g * np.exp(-x))
+
+
+if numba is not None:
+    # 一時配列を作らず 1 ループに融合した ufunc
+    @numba.vectorize(["float64(float64)"], nopython=True, fastmath=True, cache=True)
+    def F_half_aymerich_humet_np(x):
+        base = b + x + (abs(x - b) ** c + a) ** (1 / c)
+        return 1.0 / (k / (base * math.sqrt(base)) + g * math.exp(-x))
+
+else:
+    F_half_aymerich_humet_np = _F_half_aymerich_humet_np
+
+
+# brentq など 1 点ずつ呼ぶ用途向けのスカラー版 (ufunc のディスパッチを避ける)
+def _F_half_aymerich_humet_scalar(x: float) -> float:
+    base = b + x + (abs(x - b) ** c + a) ** (1 / c)
+    return 1.0 / (k / (base * math.sqrt(base)) + g * math.exp(-x))
+
+
+# 上の近似式の x による導関数 (Newton 法の fprime 用)
+#   F = 1 / D, D = k base^(-3/2) + g e^(-x) より dF/dx = -F^2 dD/dx
+def _dF_half_aymerich_humet_scalar(x: float) -> float:
+    d = x - b
+    ad = abs(d)
+    inner = ad**c + a
+    base = b + x + inner ** (1 / c)
+    dbase = 1.0 + inner ** (1 / c - 1) * ad ** (c - 2) * d
+    sb = math.sqrt(base)
+    ex = math.exp(-x)
+    F = 1.0 / (k / (base * sb) + g * ex)
+    return F * F * (1.5 * k * dbase / (base * base * sb) + g * ex)
+
+
+if numba is not None:
+    F_half_aymerich_humet_scalar = numba.njit(cache=True, fastmath=True)(
+        _F_half_aymerich_humet_scalar
+    )
+    dF_half_aymerich_humet_scalar = numba.njit(cache=True, fastmath=True)(
+        _dF_half_aymerich_humet_scalar
     )
+else:
+    F_half_aymerich_humet_scalar = _F_half_aymerich_humet_scalar
+    dF_half_aymerich_humet_scalar = _dF_half_aymerich_humet_scalar
 
 
 def _abs_smooth(y):
     return sqrt(y * y + eps * eps)
 
 
-def _clamp(val, bound):
-    return IfPos(val - bound, bound, IfPos(-bound - val, -bound, val))
+def _clamp(val, bound, knee=0.9):
+    # |val| <= knee * bound では恒等, その外側は ±bound に滑らかに飽和 (C^1 連続)
+    k = knee * bound
+    w = bound - k
+
+    def _tail(y):
+        t = (y - k) / w
+        return k + w * t / sqrt(1 + t * t)
+
+    return IfPos(val - k, _tail(val), IfPos(-k - val, -_tail(-val), val))
 
 
 def _safe_exp(x):
@@ -30,7 +87,5 @@ def _safe_exp(x):
 
 
 def F_half_aymerich_humet_ng(x):
-    return 1.0 / (
-        3 * sqrt(2) * (b + x + (_abs_smooth(x - b) ** c + a) ** (1 / c)) ** (-1.5)
-        + g * _safe_exp(-x)
-    )
+    base = b + x + (_abs_smooth(x - b) ** c + a) ** (1 / c)
+    return 1.0 / (k / (base * sqrt(base)) + g * _safe_exp(-x))
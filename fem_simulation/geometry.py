@@ -1,4 +1,4 @@
-from logging import getLogger
+from logging import INFO, getLogger
 from dataclasses import dataclass, asdict
 import numpy as np
 import scipy.constants as const
@@ -55,7 +55,8 @@ class GeometricParameters:
         assert self.n_tip_arc_points >= 3 and self.n_tip_arc_points % 2 == 1
         assert 0.1 <= self.mesh_scale <= 10.0
 
-        logger.info(asdict(self))
+        if logger.isEnabledFor(INFO):
+            logger.info(asdict(self))
         # lines = json.dumps(asdict(self), indent=4).splitlines()
         # for line in lines:
         #     logger.info(line)
@@ -95,7 +96,7 @@ def create_mesh(geom: GeometricParameters) -> Mesh:
     tip_arc_r = tip_radius * np.sin(theta)
     tip_arc_z = tip_arc_center - tip_radius * np.cos(theta)
     tip_arc_points = [
-        g.AppendPoint(r, z) for r, z in zip(list(tip_arc_r), list(tip_arc_z))
+        g.AppendPoint(r, z) for r, z in zip(tip_arc_r.tolist(), tip_arc_z.tolist())
     ]
     tip_edge_r = tip_arc_r[-1] + (l_vac - tip_arc_z[-1]) * np.tan(tip_slope_rad)
     tip_edge = g.AppendPoint(tip_edge_r, l_vac)
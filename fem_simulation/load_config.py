@@ -1,11 +1,16 @@
-import toml
+import sys
 from logging import getLogger
 from dataclasses import dataclass, asdict
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
 logger = getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FEMConfig:
     physical_parameters: dict
     geometric_parameters: dict
@@ -14,8 +19,8 @@ class FEMConfig:
 
 
 def load_config(config_path: str) -> FEMConfig:
-    with open(config_path, "r") as f:
-        conf_dict = toml.load(f)
+    with open(config_path, "rb") as f:
+        conf_dict = tomllib.load(f)
     logger.info(f"Configuration loaded from {config_path}")
     return FEMConfig(
         physical_parameters=conf_dict["physical_parameters"],
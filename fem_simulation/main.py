@@ -5,11 +5,9 @@ python main.py [config_path] [log_path]
 """
 
 import sys
-import shutil
 from dataclasses import asdict
 from logging import basicConfig, INFO, getLogger
 from pathlib import Path
-import toml
 
 from load_config import load_config
 from physical_parameters import PhysicalParameters
@@ -21,6 +19,9 @@ logger = getLogger(__name__)
 
 
 def main(config_path: str):
+    # 出力時にしか使わないモジュールは遅延 import
+    import shutil
+
     logger.info(f"Loading configuration from {config_path}")
     conf = load_config(config_path)
     phys = PhysicalParameters(**conf.physical_parameters)
@@ -30,30 +31,69 @@ def main(config_path: str):
 
     # 設定とパラメータを保存
     out_dir = Path(conf.out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    # config.toml: 入力設定をコピー
-    shutil.copy(config_path, out_dir / "config.toml")
-    logger.info(f"Configuration copied to {out_dir / 'config.toml'}")
-
-    # params.toml: 計算されたパラメータを含む完全な状態
-    params_path = out_dir / "params.toml"
-    with open(params_path, "w") as f:
-        toml.dump(
-            {
-                "physical_parameters": asdict(phys),
-                "geometric_parameters": asdict(geom),
-                "simulation_parameters": asdict(siml),
-            },
-            f,
-        )
+    if not out_dir.exists():
+        out_dir.mkdir(parents=True)
+
+    # config.toml: 入力設定をコピー (out_dir 内の config.toml から実行した場合は不要)
+    src = Path(config_path).resolve()
+    dst = (out_dir / "config.toml").resolve()
+    if src != dst:
+        shutil.copyfile(src, dst)
+        logger.info(f"Configuration copied to {dst}")
+
+    # 計算されたパラメータを含む完全な状態
+    params = {
+        "physical_parameters": phys.to_dict(),
+        "geometric_parameters": asdict(geom),
+        "simulation_parameters": asdict(siml),
+    }
+    # params.json: 機械可読な形式 (常に出力)
+    params_path = out_dir / "params.json"
+    _write_params_json(params_path, params)
     logger.info(f"Parameters saved to {params_path}")
+    # params.toml: 人が読むための形式 (export_toml = false で省略)
+    if siml.export_toml:
+        params_path = out_dir / "params.toml"
+        _write_params_toml(params_path, params)
+        logger.info(f"Parameters saved to {params_path}")
 
     logger.info("Starting FEM simulation")
     run_fem(mesh, phys, geom, siml, out_dir)
     logger.info("FEM simulation completed")
 
 
+def _write_params_json(path: Path, params: dict):
+    try:
+        import orjson
+    except ImportError:  # orjson が無ければ標準の json で書き出す
+        import json
+
+        with open(path, "w") as f:
+            json.dump(params, f, indent=2)
+        return
+
+    with open(path, "wb") as f:
+        f.write(
+            orjson.dumps(
+                params, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+            )
+        )
+
+
+def _write_params_toml(path: Path, params: dict):
+    try:
+        import tomli_w
+    except ImportError:  # tomli_w が無ければ toml (純 Python 実装) で書き出す
+        import toml
+
+        with open(path, "w") as f:
+            toml.dump(params, f)
+        return
+
+    with open(path, "wb") as f:
+        tomli_w.dump(params, f)
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         config_path = sys.argv[1]
@@ -1,15 +1,14 @@
-from logging import getLogger
-from dataclasses import dataclass, asdict, field
+import math
+from logging import INFO, getLogger
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 import numpy as np
 import scipy.constants as const
-from scipy.optimize import brentq
-
-from fermi_dirac_integral import F_half_aymerich_humet_np
 
 logger = getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PhysicalParameters:
     T: float = 300.0  # temperature [K]
 
@@ -44,17 +43,26 @@ class PhysicalParameters:
 
     # calculated after initialization
     kT: float = 0.0
+    inv_kT: float = field(default=0.0, init=False, repr=False)  # 1 / kT [eV^-1] (キャッシュ)
     n0: float = 0.0
     p0: float = 0.0
     Nc: float = 0.0
     Nv: float = 0.0
     Ef: float = 0.0
+    # 各準位の重み (ratio / sum(ratios)) と無次元化したエネルギー
+    #   donor: (Ef - Eg + Ed) / kT, acceptor: (Ea - Ef) / kT
+    # NOTE: 計算用のキャッシュなので init=False とし, 出力 (to_dict) には含めない
+    donor_weights: list[float] = field(default_factory=list, init=False, repr=False)
+    donor_shifts: list[float] = field(default_factory=list, init=False, repr=False)
+    acceptor_weights: list[float] = field(default_factory=list, init=False, repr=False)
+    acceptor_shifts: list[float] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self):
         assert len(self.Ed) == len(self.donor_ratios)
         assert len(self.Ea) == len(self.acceptor_ratios)
 
         self.kT = const.k * self.T / const.e  # [eV]
+        self.inv_kT = 1.0 / self.kT
 
         self.n0 = float((self.Nd + np.sqrt(self.Nd**2 + 4 * self.ni**2)) / 2)
         self.p0 = float(self.ni**2 / self.n0)
@@ -68,42 +76,131 @@ class PhysicalParameters:
             * 2
             * (2 * np.pi * self.mdh * const.k * self.T / (const.h**2)) ** 1.5
         )
+        self.donor_weights = _normalize(self.donor_ratios).tolist()
+        self.acceptor_weights = _normalize(self.acceptor_ratios).tolist()
+
         self.Ef = self.calc_fermi_level()
 
-        logger.info(asdict(self))
+        Ed = np.asarray(self.Ed, dtype=np.float64)
+        Ea = np.asarray(self.Ea, dtype=np.float64)
+        self.donor_shifts = ((self.Ef - self.Eg + Ed) * self.inv_kT).tolist()
+        self.acceptor_shifts = ((Ea - self.Ef) * self.inv_kT).tolist()
+
+        if logger.isEnabledFor(INFO):
+            logger.info(self.to_dict())
+
+    def to_dict(self) -> dict:
+        # params.json / params.toml 用. init=False の計算用キャッシュは除く
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
     def calc_fermi_level(self) -> float:
-        def charge_neutrality_eq(Ef: float):
-            n = self.Nc * F_half_aymerich_humet_np((Ef - self.Eg) / self.kT)
-            p = self.Nv * F_half_aymerich_humet_np(-Ef / self.kT)
-
-            Ndp = 0.0
-            sum_ratios_d = sum(self.donor_ratios)
-            for Ed, ratio in zip(self.Ed, self.donor_ratios):
-                Ndp += (
-                    self.Nd
-                    * (ratio / sum_ratios_d)
-                    / (1 + 2 * np.exp((Ef - self.Eg + Ed) / self.kT))
-                )
-
-            Nap = 0.0
-            sum_ratios_a = sum(self.acceptor_ratios)
-            for Ea, ratio in zip(self.Ea, self.acceptor_ratios):
-                Nap += (
-                    self.Na
-                    * (ratio / sum_ratios_a)
-                    / (1 + 4 * np.exp((Ea - Ef) / self.kT))
-                )
-
-            # 安定性のため対数を取る
-            return np.log(p + Ndp) - np.log(n + Nap)
-
-        Ef_lower = self.kT
-        Ef_upper = self.Eg - self.kT
-        Ef, r = brentq(charge_neutrality_eq, Ef_lower, Ef_upper, full_output=True)
-        if not r.converged:
-            logger.error("Fermi level calculation did not converge.")
-            logger.error(str(r))
-            raise RuntimeError("Fermi level calculation did not converge.")
-
-        return Ef
+        # 同じ物性値で何度も生成される場合に備え, ハッシュ可能な引数でキャッシュする
+        return _calc_fermi_level(
+            self.Nc,
+            self.Nv,
+            self.Nd,
+            self.Na,
+            self.kT,
+            self.Eg,
+            tuple(self.Ed),
+            tuple(self.donor_weights),
+            tuple(self.Ea),
+            tuple(self.acceptor_weights),
+        )
+
+
+@lru_cache(maxsize=128)
+def _calc_fermi_level(
+    Nc: float,
+    Nv: float,
+    Nd: float,
+    Na: float,
+    kT: float,
+    Eg: float,
+    Ed: tuple[float, ...],
+    donor_weights: tuple[float, ...],
+    Ea: tuple[float, ...],
+    acceptor_weights: tuple[float, ...],
+) -> float:
+    from scipy.optimize import brentq, root_scalar
+    from fermi_dirac_integral import (
+        F_half_aymerich_humet_scalar,
+        dF_half_aymerich_humet_scalar,
+    )
+
+    # brentq から何度も呼ばれるので, 定数はローカル変数に束縛し kT で割っておく
+    inv_kT = 1.0 / kT
+    Eg_kT = Eg * inv_kT
+    F_half = F_half_aymerich_humet_scalar
+    dF_half = dF_half_aymerich_humet_scalar
+    log = math.log
+
+    # 各準位の和は NumPy 配列でまとめて計算 (空の場合は 0)
+    Ed_kT = (np.asarray(Ed, dtype=np.float64) - Eg) * inv_kT
+    Ea_kT = np.asarray(Ea, dtype=np.float64) * inv_kT
+    w_d = np.asarray(donor_weights, dtype=np.float64)
+    w_a = np.asarray(acceptor_weights, dtype=np.float64)
+
+    def charge_neutrality_eq(Ef: float):
+        Ef_kT = Ef * inv_kT
+        n = Nc * F_half(Ef_kT - Eg_kT)
+        p = Nv * F_half(-Ef_kT)
+
+        Ndp = Nd * float(np.sum(w_d / (1 + 2 * np.exp(Ef_kT + Ed_kT))))
+        Nap = Na * float(np.sum(w_a / (1 + 4 * np.exp(Ea_kT - Ef_kT))))
+
+        # 安定性のため対数を取る
+        return log(p + Ndp) - log(n + Nap)
+
+    def charge_neutrality_eq_and_prime(Ef: float):
+        Ef_kT = Ef * inv_kT
+        n = Nc * F_half(Ef_kT - Eg_kT)
+        p = Nv * F_half(-Ef_kT)
+        dn = Nc * dF_half(Ef_kT - Eg_kT) * inv_kT
+        dp = -Nv * dF_half(-Ef_kT) * inv_kT
+
+        ed = 2 * np.exp(Ef_kT + Ed_kT)
+        ea = 4 * np.exp(Ea_kT - Ef_kT)
+        Ndp = Nd * float(np.sum(w_d / (1 + ed)))
+        Nap = Na * float(np.sum(w_a / (1 + ea)))
+        dNdp = -Nd * inv_kT * float(np.sum(w_d * ed / (1 + ed) ** 2))
+        dNap = Na * inv_kT * float(np.sum(w_a * ea / (1 + ea) ** 2))
+
+        f = log(p + Ndp) - log(n + Nap)
+        df = (dp + dNdp) / (p + Ndp) - (dn + dNap) / (n + Nap)
+        return f, df
+
+    Ef_lower = kT
+    Ef_upper = Eg - kT
+
+    # 滑らかな関数なので解析的な導関数を使った Newton 法を先に試し,
+    # 収束しない / 区間外に出た場合のみ brentq にフォールバックする
+    try:
+        sol = root_scalar(
+            charge_neutrality_eq_and_prime,
+            x0=0.5 * (Ef_lower + Ef_upper),
+            fprime=True,
+            method="newton",
+            xtol=2e-12,
+            maxiter=50,
+        )
+        if sol.converged and Ef_lower <= sol.root <= Ef_upper:
+            return float(sol.root)
+        logger.debug("Newton did not converge in bracket; falling back to brentq.")
+    except (ArithmeticError, ValueError):
+        logger.debug("Newton failed; falling back to brentq.")
+
+    Ef, r = brentq(charge_neutrality_eq, Ef_lower, Ef_upper, full_output=True)
+    if not r.converged:
+        logger.error("Fermi level calculation did not converge.")
+        logger.error(str(r))
+        raise RuntimeError("Fermi level calculation did not converge.")
+
+    return Ef
+
+
+def _normalize(ratios: list[float]) -> np.ndarray:
+    ratios_np = np.asarray(ratios, dtype=np.float64)
+    if ratios_np.size == 0:
+        return ratios_np
+    return ratios_np / ratios_np.sum()
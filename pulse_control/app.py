@@ -7,10 +7,12 @@ Usage:
 from __future__ import annotations
 
 import csv
+import math
+import os
 import re
-import tempfile
 import time
-from datetime import datetime
+from functools import lru_cache
+from typing import Callable
 from logging import getLogger
 from pathlib import Path
 
@@ -24,13 +26,13 @@ from config import (
     PumpProbeConfig,
     SweepConfig,
     load_unified_toml,
+    loads_unified_toml,
     next_save_path,
     save_unified_toml,
 )
 from core import (
     PulseInstrument,
     _calc_arb_params,
-    _generate_intervals,
     _generate_widths,
     run_delay_sweep,
     run_interval_sweep,
@@ -59,38 +61,43 @@ st.set_page_config(page_title="Pulse Control", layout="wide")
 #  SI prefix parse / format
 # ================================================================== #
 _SI_PREFIXES: dict[str, float] = {
-    "n": 1e-9, "u": 1e-6, "μ": 1e-6, "m": 1e-3,
+    "": 1.0, "n": 1e-9, "u": 1e-6, "μ": 1e-6, "m": 1e-3,
     "k": 1e3, "M": 1e6,
 }
-_SI_PARSE_RE = re.compile(r"^\s*([+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)\s*([nuμmkM])?\s*$")
+_SI_PARSE_RE = re.compile(r"([+-]?\d+\.?\d*(?:[eE][+-]?\d+)?)\s*([nuμmkM]?)")
 
 # Ordered largest-first for formatting
 _FORMAT_PREFIXES = [(1e6, "M"), (1e3, "k"), (1, ""), (1e-3, "m"), (1e-6, "u"), (1e-9, "n")]
 
 
+@lru_cache(maxsize=1024)
 def parse_si(text: str) -> float:
     """Parse SI-prefixed string: '1n' -> 1e-9, '10u' -> 10e-6, '20k' -> 20e3."""
-    m = _SI_PARSE_RE.match(text)
+    # No float() shortcut: it would also accept "1_000", ".5", "inf", ...
+    m = _SI_PARSE_RE.fullmatch(text.strip())
     if not m:
         raise ValueError(f"Invalid value: {text!r}")
-    num = float(m.group(1))
-    prefix = m.group(2)
-    if prefix:
-        num *= _SI_PREFIXES[prefix]
-    return num
+    # "" maps to 1.0, so no branch on whether a prefix was given
+    return float(m.group(1)) * _SI_PREFIXES[m.group(2)]
 
 
+@lru_cache(maxsize=1024)
 def format_si(value: float) -> str:
     """Format to SI-prefixed string: 1e-9 -> '1n', 0.02 -> '20m', 20000 -> '20k'."""
     if value == 0:
         return "0"
-    for factor, prefix in _FORMAT_PREFIXES:
+    if not math.isfinite(value):
+        return f"{value:g}"
+    # Pick the prefix from the decade; clamp to the table for out-of-range values
+    last = len(_FORMAT_PREFIXES) - 1
+    idx = min(max(2 - math.floor(math.log10(abs(value)) / 3), 0), last)
+    factor, prefix = _FORMAT_PREFIXES[idx]
+    scaled = value / factor
+    if abs(scaled) < 1 and idx < last:
+        # log10 rounded up just below a power of 1000
+        factor, prefix = _FORMAT_PREFIXES[idx + 1]
         scaled = value / factor
-        if abs(scaled) >= 1:
-            return f"{scaled:g}{prefix}"
-    # Fallback for extremely small values
-    factor, prefix = _FORMAT_PREFIXES[-1]
-    return f"{value / factor:g}{prefix}"
+    return f"{scaled:g}{prefix}"
 
 
 def _save_records_to_csv(records: list[dict]) -> None:
@@ -113,6 +120,7 @@ def _load_records_from_csv() -> list[dict]:
             records.append({
                 "timestamp": row["timestamp"],
                 "pulse_width": row["pulse_width"],
+                "pulse_width_s": parse_si(row["pulse_width"]),
                 "trigger_delay": int(row["trigger_delay"]),
             })
     return records
@@ -138,20 +146,106 @@ def _load_pp_records_from_csv() -> list[dict]:
             records.append({
                 "timestamp": row["timestamp"],
                 "pulse_interval": row["pulse_interval"],
+                "pulse_interval_s": parse_si(row["pulse_interval"]),
                 "trigger_delay": int(row["trigger_delay"]),
             })
     return records
 
 
-_CHANNEL_MAP = {"CH1": [1], "CH2": [2], "Both": [1, 2]}
+def _records_table(records: list[dict], x_field: str) -> list[tuple[float, int]]:
+    """Numeric (x [s], trigger_delay) pairs of saved records, e.g. for delay tables.
+
+    Records carry the parsed value as ``{x_field}_s`` next to the display string,
+    so no SI parsing is needed here.
+    """
+    x_key = f"{x_field}_s"
+    return [(r[x_key], r["trigger_delay"]) for r in records]
+
+
+def _records_columns(records: list[dict], x_field: str) -> dict[str, list]:
+    """Column-oriented view of saved records for ``st.dataframe``."""
+    return {
+        "timestamp": [r["timestamp"] for r in records],
+        x_field: [r[x_field] for r in records],
+        "trigger_delay": [r["trigger_delay"] for r in records],
+    }
+
+
+_CHANNEL_MAP = {"CH1": (1,), "CH2": (2,), "Both": (1, 2)}
+
+# Delay-mode radios store the config value directly and only title-case it for display
+_DELAY_MODE_EXPONENT = "exponent"
+_DELAY_MODE_TABLE = "table"
+_DELAY_MODES = (_DELAY_MODE_EXPONENT, _DELAY_MODE_TABLE)
+
+
+def _delay_mode_of(cfg: dict) -> str:
+    """Delay mode from a sweep config section, falling back to exponent."""
+    return _DELAY_MODE_TABLE if cfg.get("delay_mode") == _DELAY_MODE_TABLE else _DELAY_MODE_EXPONENT
+
+# (config field, widget key) pairs parsed with parse_si on every rerun
+_WIDTH_SWEEP_SI_FIELDS = (
+    ("width_start", "_w_width_start"),
+    ("width_stop", "_w_width_stop"),
+    ("width_step", "_w_width_step"),
+    ("wait_time", "_w_wait_time"),
+)
+_INTERVAL_SWEEP_SI_FIELDS = (
+    ("pulse_width", "_w_interval_pulse_width"),
+    ("interval_start", "_w_interval_start"),
+    ("interval_stop", "_w_interval_stop"),
+    ("interval_step", "_w_interval_step"),
+    ("wait_time", "_w_interval_wait_time"),
+)
+_PULSE_SI_FIELDS = (
+    ("pulse_width", "_w_pulse_width"),
+)
+_PP_SI_FIELDS = (
+    ("pulse_width", "_w_pp_pulse_width"),
+    ("pulse_interval", "_w_pp_pulse_interval"),
+)
+_DELAY_SWEEP_SI_FIELDS = (
+    ("pulse_width", "_w_delay_pulse_width"),
+    ("wait_time", "_w_delay_wait_time"),
+)
 
 MAX_SAMPLE_RATE = 4.2e9  # 81180A maximum sample clock
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_arb_params(
+    frequency: float, widths: tuple[float, ...], *,
+    intervals: tuple[float, ...] | None = None,
+    resolution_n: int = 1,
+) -> tuple[float, int]:
+    """_calc_arb_params memoized across reruns (inputs passed as tuples)."""
+    return _calc_arb_params(
+        frequency, list(widths),
+        intervals=list(intervals) if intervals is not None else None,
+        resolution_n=resolution_n,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_widths(
+    start: float, stop: float, step: float,
+    step_zones: tuple[tuple[float, float], ...] | None = None,
+) -> tuple[float, ...]:
+    """_generate_widths memoized across reruns (also used for interval previews)."""
+    return tuple(_generate_widths(
+        start, stop, step, step_zones=list(step_zones) if step_zones else None,
+    ))
+
+
+def _zones_key(step_zones: list[tuple[float, float]] | None) -> tuple[tuple[float, float], ...] | None:
+    """Hashable form of step_zones for the cached generators."""
+    return tuple(map(tuple, step_zones)) if step_zones else None
+
+
 def _show_arb_info(frequency: float, widths: list[float], *, resolution_n: int = 1) -> None:
     """Show arbitrary waveform parameters in a collapsed expander."""
     try:
-        sample_rate, pts = _calc_arb_params(frequency, widths, resolution_n=resolution_n)
+        sample_rate, pts = _cached_arb_params(frequency, tuple(widths), resolution_n=resolution_n)
     except Exception as exc:
         st.warning(f"ARB calc error: {exc}")
         return
@@ -178,11 +272,96 @@ def _show_arb_info(frequency: float, widths: list[float], *, resolution_n: int =
         })
 
 
+def _wait_with_progress(progress, duration: float, label: Callable[[float], str]) -> None:
+    """Block for ``duration`` seconds while redrawing ``progress`` (at most ~60 redraws).
+
+    The last sleep is clipped to the remaining time so the wait still ends on schedule.
+    """
+    tick = max(0.5, duration / 60)
+    t0 = time.time()
+    while (elapsed := time.time() - t0) < duration:
+        progress.progress(elapsed / duration, text=label(elapsed))
+        time.sleep(min(tick, duration - elapsed))
+
+
+def _wait_settling(progress, settling_time: float) -> None:
+    """Settling phase: block for ``settling_time`` seconds with an elapsed/total bar."""
+    suffix = f"s / {settling_time:.1f}s"  # constant part of the label, formatted once
+    _wait_with_progress(progress, settling_time, lambda elapsed: f"Settling... {elapsed:.1f}{suffix}")
+
+
+def _throttled_progress(callback: Callable[[int, int], None], min_interval: float = 0.1) -> Callable[[int, int], None]:
+    """Wrap an ``(i, total)`` progress callback so it redraws at most every ``min_interval`` s
+    and only when the integer percentage changes (<= ~100 redraws per run).
+
+    The callbacks run inside the instrument loop, so skipped calls return without
+    touching Streamlit. The final step always goes through so the bar reaches 100%.
+    """
+    last = -math.inf
+    last_pct = -1
+
+    def wrapper(i: int, total: int) -> None:
+        nonlocal last, last_pct
+        pct = (i + 1) * 100 // total
+        if i + 1 < total:
+            if pct == last_pct:
+                return
+            now = time.monotonic()
+            if now - last < min_interval:
+                return
+            last = now
+        last_pct = pct
+        callback(i, total)
+
+    return wrapper
+
+
+def _sweep_progress(progress) -> Callable[[int, int], None]:
+    """Throttled ``(i, total)`` sweep callback showing elapsed time and an ETA.
+
+    The ETA uses an exponential moving average of the step rate measured between
+    redraws, so it follows changes in per-step time instead of the run average.
+    """
+    t0 = last_t = time.monotonic()
+    last_n = 0
+    rate = 0.0  # steps / s (EMA)
+
+    def on_step(i: int, total: int) -> None:
+        nonlocal last_t, last_n, rate
+        n = i + 1
+        now = time.monotonic()
+        if now > last_t:
+            step_rate = (n - last_n) / (now - last_t)
+            rate = step_rate if rate == 0.0 else 0.9 * rate + 0.1 * step_rate
+            last_t, last_n = now, n
+        remaining = (total - n) / rate if rate > 0 else 0
+        progress.progress(
+            n / total,
+            text=f"Sweeping... {n}/{total} ({now - t0:.1f}s elapsed, ~{remaining:.0f}s remaining)",
+        )
+
+    return _throttled_progress(on_step)
+
+
 # ================================================================== #
 #  Session initialisation (unified TOML)
 # ================================================================== #
+@st.cache_data(max_entries=8)
+def _load_default_config(path: str, mtime: float) -> dict:
+    """Parse the default TOML once per (path, mtime) across sessions and reruns."""
+    return load_unified_toml(path)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _parse_uploaded_config(data: bytes) -> dict:
+    """Parse an uploaded unified TOML, memoized on the file contents."""
+    return loads_unified_toml(data)
+
+
 if "unified_config" not in st.session_state:
-    st.session_state.unified_config = load_unified_toml(DEFAULT_CONFIG)
+    st.session_state.unified_config = _load_default_config(
+        str(DEFAULT_CONFIG), DEFAULT_CONFIG.stat().st_mtime,
+    )
 
 ucfg: dict = st.session_state.unified_config
 _save = ucfg.get("save", {})
@@ -200,12 +379,22 @@ _ss = ucfg.get("step_sync", {})
 # ================================================================== #
 #  Callbacks: frequency <-> period sync
 # ================================================================== #
+def _period_text_for(freq: float) -> str:
+    """Return format_si(1/freq), reusing the last result while freq is unchanged."""
+    if freq <= 0:
+        return "0"
+    if st.session_state.get("_cached_freq") != freq:
+        st.session_state._cached_freq = freq
+        st.session_state._cached_period_text = format_si(1.0 / freq)
+    return st.session_state._cached_period_text
+
+
 def _on_freq_change() -> None:
     """Frequency text changed -> recalculate period."""
     try:
         freq = parse_si(st.session_state._w_freq)
         if freq > 0:
-            st.session_state._w_period = format_si(1.0 / freq)
+            _set_widget("_w_period", _period_text_for(freq))
     except ValueError:
         pass
 
@@ -215,11 +404,23 @@ def _on_period_change() -> None:
     try:
         period = parse_si(st.session_state._w_period)
         if period > 0:
-            st.session_state._w_freq = format_si(1.0 / period)
+            _set_widget("_w_freq", format_si(1.0 / period))
     except ValueError:
         pass
 
 
+def _default_si(key: str, value: float | None) -> None:
+    """Seed an SI text widget on first render only, so reruns skip format_si."""
+    if key not in st.session_state:
+        st.session_state[key] = format_si(value) if value is not None else ""
+
+
+def _set_widget(key: str, value) -> None:
+    """Assign a widget value only if it differs, so unchanged widgets stay untouched."""
+    if st.session_state.get(key) != value:
+        st.session_state[key] = value
+
+
 def _load_config_to_widgets(data: dict) -> None:
     """Push unified TOML data into widget session state.
 
@@ -242,30 +443,31 @@ def _load_config_to_widgets(data: dict) -> None:
     ss = data.get("step_sync", {})
 
     # Save settings
-    st.session_state._w_save_dir = save.get("save_dir", "configs")
-    st.session_state._w_filename_format = save.get("filename_format", "")
+    _set_widget("_w_save_dir", save.get("save_dir", "configs"))
+    _set_widget("_w_filename_format", save.get("filename_format", ""))
 
     # Connection
-    st.session_state._w_visa_address = conn.get("visa_address", DEFAULT_VISA_ADDRESS)
+    _set_widget("_w_visa_address", conn.get("visa_address", DEFAULT_VISA_ADDRESS))
 
     # Common
-    st.session_state._w_v_on = common.get("v_on", 0.0)
-    st.session_state._w_v_off = common.get("v_off", -1.0)
+    _set_widget("_w_v_on", common.get("v_on", 0.0))
+    _set_widget("_w_v_off", common.get("v_off", -1.0))
     freq = common.get("frequency", 10_000_000.0)
-    st.session_state._w_freq = format_si(freq)
+    _set_widget("_w_freq", format_si(freq))
     if freq > 0:
-        st.session_state._w_period = format_si(1.0 / freq)
-    st.session_state._w_trigger_delay = common.get("trigger_delay", 0)
-    st.session_state._w_resolution_n = common.get("resolution_n", 1)
+        _set_widget("_w_period", _period_text_for(freq))
+    _set_widget("_w_trigger_delay", common.get("trigger_delay", 0))
+    _set_widget("_w_resolution_n", common.get("resolution_n", 1))
 
     # Simple Pulse
-    st.session_state._w_pulse_width = format_si(sp.get("pulse_width", 1e-8))
+    _set_widget("_w_pulse_width", format_si(sp.get("pulse_width", 1e-8)))
 
     # saved_pulse_records (non-widget state)
     _saved = sp.get("saved_records") or ws.get("delay_table")
     if _saved is not None:
         st.session_state.saved_pulse_records = [
-            {"timestamp": "", "pulse_width": format_si(row[0]), "trigger_delay": int(row[1])}
+            {"timestamp": "", "pulse_width": format_si(row[0]), "pulse_width_s": float(row[0]),
+             "trigger_delay": int(row[1])}
             for row in _saved
         ]
     elif not st.session_state.get("saved_pulse_records"):
@@ -274,66 +476,66 @@ def _load_config_to_widgets(data: dict) -> None:
             st.session_state.saved_pulse_records = _csv_records
 
     # Width Sweep
-    st.session_state._w_width_start = format_si(ws.get("width_start", 1e-8))
-    st.session_state._w_width_stop = format_si(ws.get("width_stop", 5e-8))
-    st.session_state._w_width_step = format_si(ws.get("width_step", 5e-9))
-    st.session_state._w_wait_time = format_si(ws.get("wait_time", 1.0))
-    st.session_state._w_settling_time = ws.get("settling_time", 0.0)
+    _set_widget("_w_width_start", format_si(ws.get("width_start", 1e-8)))
+    _set_widget("_w_width_stop", format_si(ws.get("width_stop", 5e-8)))
+    _set_widget("_w_width_step", format_si(ws.get("width_step", 5e-9)))
+    _set_widget("_w_wait_time", format_si(ws.get("wait_time", 1.0)))
+    _set_widget("_w_settling_time", ws.get("settling_time", 0.0))
     td_stop = ws.get("trigger_delay_stop")
-    st.session_state._w_trigger_delay_stop = (
+    _set_widget("_w_trigger_delay_stop",
         td_stop if td_stop is not None else common.get("trigger_delay", 0)
     )
-    st.session_state._w_delay_exponent = ws.get("delay_exponent", 1.0)
-    _dm = ws.get("delay_mode", "exponent")
-    st.session_state._w_delay_mode_radio = "Exponent" if _dm == "exponent" else "Table"
+    _set_widget("_w_delay_exponent", ws.get("delay_exponent", 1.0))
+    _set_widget("_w_delay_mode_radio", _delay_mode_of(ws))
     _sz = ws.get("step_zones", [])
-    st.session_state._w_variable_step = bool(_sz)
+    _set_widget("_w_variable_step", bool(_sz))
     if _sz:
         z1 = _sz[0] if len(_sz) >= 1 else [None, None]
-        st.session_state._w_step_zone1_boundary = format_si(z1[0]) if z1[0] is not None else ""
-        st.session_state._w_step_zone1_step = format_si(z1[1]) if z1[1] is not None else ""
+        _set_widget("_w_step_zone1_boundary", format_si(z1[0]) if z1[0] is not None else "")
+        _set_widget("_w_step_zone1_step", format_si(z1[1]) if z1[1] is not None else "")
         z2 = _sz[1] if len(_sz) >= 2 else [None, None]
-        st.session_state._w_step_zone2_boundary = format_si(z2[0]) if z2[0] is not None else ""
-        st.session_state._w_step_zone2_step = format_si(z2[1]) if z2[1] is not None else ""
-    st.session_state._w_sync_mode = (
+        _set_widget("_w_step_zone2_boundary", format_si(z2[0]) if z2[0] is not None else "")
+        _set_widget("_w_step_zone2_step", format_si(z2[1]) if z2[1] is not None else "")
+    _set_widget("_w_sync_mode",
         "Step-Synced" if ws.get("sync_mode", "ramp") == "step_synced" else "Ramp Detection")
 
     # Integration (Auto Sweep)
-    st.session_state._w_ig_dmm_address = ig.get("dmm_visa_address", DEFAULT_34401A_ADDRESS)
-    st.session_state._w_ig_trigger_start = ig.get("trigger_start_voltage", -9.8)
-    st.session_state._w_ig_trigger_end = ig.get("trigger_end_voltage", -9.2)
-    st.session_state._w_ig_sweep_start = ig.get("sweep_start_voltage", -9.0)
-    st.session_state._w_ig_poll_interval = ig.get("poll_interval", 1.0)
-    st.session_state._w_ig_num_cycles = ig.get("num_cycles", 0)
+    _set_widget("_w_ig_dmm_address", ig.get("dmm_visa_address", DEFAULT_34401A_ADDRESS))
+    _set_widget("_w_ig_trigger_start", ig.get("trigger_start_voltage", -9.8))
+    _set_widget("_w_ig_trigger_end", ig.get("trigger_end_voltage", -9.2))
+    _set_widget("_w_ig_sweep_start", ig.get("sweep_start_voltage", -9.0))
+    _set_widget("_w_ig_poll_interval", ig.get("poll_interval", 1.0))
+    _set_widget("_w_ig_num_cycles", ig.get("num_cycles", 0))
 
     # Step-Sync
-    st.session_state._w_ss_total_steps = int(ss.get("total_steps", 30))
-    st.session_state._w_ss_sweep_start_step = int(ss.get("sweep_start_step", 10))
-    st.session_state._w_ss_confirm_reads = int(ss.get("confirm_reads", 2))
-    st.session_state._w_ss_v_start = ss.get("v_start", -10.0)
-    st.session_state._w_ss_v_stop = ss.get("v_stop", 10.0)
-    st.session_state._w_ss_poll_interval = ss.get("poll_interval", 0.1)
-    st.session_state._w_ss_step_timeout = ss.get("step_timeout", 10.0)
-    st.session_state._w_ss_restart_voltage = ss.get("restart_voltage", -9.5)
-    st.session_state._w_ss_restart_timeout = ss.get("restart_timeout", 60.0)
+    _set_widget("_w_ss_total_steps", int(ss.get("total_steps", 30)))
+    _set_widget("_w_ss_sweep_start_step", int(ss.get("sweep_start_step", 10)))
+    _set_widget("_w_ss_confirm_reads", int(ss.get("confirm_reads", 2)))
+    _set_widget("_w_ss_v_start", ss.get("v_start", -10.0))
+    _set_widget("_w_ss_v_stop", ss.get("v_stop", 10.0))
+    _set_widget("_w_ss_poll_interval", ss.get("poll_interval", 0.1))
+    _set_widget("_w_ss_step_timeout", ss.get("step_timeout", 10.0))
+    _set_widget("_w_ss_restart_voltage", ss.get("restart_voltage", -9.5))
+    _set_widget("_w_ss_restart_timeout", ss.get("restart_timeout", 60.0))
 
     # Delay Sweep
-    st.session_state._w_delay_pulse_width = format_si(ds.get("pulse_width", 1e-8))
-    st.session_state._w_delay_start = ds.get("delay_start", 0)
-    st.session_state._w_delay_stop = ds.get("delay_stop", 80)
-    st.session_state._w_delay_step = ds.get("delay_step", 8)
-    st.session_state._w_delay_wait_time = format_si(ds.get("wait_time", 1.0))
-    st.session_state._w_delay_settling_time = ds.get("settling_time", 0.0)
+    _set_widget("_w_delay_pulse_width", format_si(ds.get("pulse_width", 1e-8)))
+    _set_widget("_w_delay_start", ds.get("delay_start", 0))
+    _set_widget("_w_delay_stop", ds.get("delay_stop", 80))
+    _set_widget("_w_delay_step", ds.get("delay_step", 8))
+    _set_widget("_w_delay_wait_time", format_si(ds.get("wait_time", 1.0)))
+    _set_widget("_w_delay_settling_time", ds.get("settling_time", 0.0))
 
     # Pump-Probe
-    st.session_state._w_pp_pulse_width = format_si(pp.get("pulse_width", 1e-8))
-    st.session_state._w_pp_pulse_interval = format_si(pp.get("pulse_interval", 2e-8))
+    _set_widget("_w_pp_pulse_width", format_si(pp.get("pulse_width", 1e-8)))
+    _set_widget("_w_pp_pulse_interval", format_si(pp.get("pulse_interval", 2e-8)))
 
     # saved_pp_records (non-widget state)
     _pp_saved = pp.get("saved_records") or isw.get("delay_table")
     if _pp_saved is not None:
         st.session_state.saved_pp_records = [
-            {"timestamp": "", "pulse_interval": format_si(row[0]), "trigger_delay": int(row[1])}
+            {"timestamp": "", "pulse_interval": format_si(row[0]), "pulse_interval_s": float(row[0]),
+             "trigger_delay": int(row[1])}
             for row in _pp_saved
         ]
     elif not st.session_state.get("saved_pp_records"):
@@ -342,52 +544,50 @@ def _load_config_to_widgets(data: dict) -> None:
             st.session_state.saved_pp_records = _pp_csv
 
     # Interval Sweep
-    st.session_state._w_interval_pulse_width = format_si(isw.get("pulse_width", 1e-8))
-    st.session_state._w_interval_start = format_si(isw.get("interval_start", 1e-8))
-    st.session_state._w_interval_stop = format_si(isw.get("interval_stop", 5e-8))
-    st.session_state._w_interval_step = format_si(isw.get("interval_step", 5e-9))
-    st.session_state._w_interval_wait_time = format_si(isw.get("wait_time", 1.0))
-    st.session_state._w_interval_settling_time = isw.get("settling_time", 0.0)
+    _set_widget("_w_interval_pulse_width", format_si(isw.get("pulse_width", 1e-8)))
+    _set_widget("_w_interval_start", format_si(isw.get("interval_start", 1e-8)))
+    _set_widget("_w_interval_stop", format_si(isw.get("interval_stop", 5e-8)))
+    _set_widget("_w_interval_step", format_si(isw.get("interval_step", 5e-9)))
+    _set_widget("_w_interval_wait_time", format_si(isw.get("wait_time", 1.0)))
+    _set_widget("_w_interval_settling_time", isw.get("settling_time", 0.0))
     td_stop_isw = isw.get("trigger_delay_stop")
-    st.session_state._w_interval_trigger_delay_stop = (
+    _set_widget("_w_interval_trigger_delay_stop",
         td_stop_isw if td_stop_isw is not None else common.get("trigger_delay", 0)
     )
-    st.session_state._w_interval_delay_exponent = isw.get("delay_exponent", 1.0)
-    _dm_isw = isw.get("delay_mode", "exponent")
-    st.session_state._w_interval_delay_mode_radio = (
-        "Exponent" if _dm_isw == "exponent" else "Table")
+    _set_widget("_w_interval_delay_exponent", isw.get("delay_exponent", 1.0))
+    _set_widget("_w_interval_delay_mode_radio", _delay_mode_of(isw))
     _isz = isw.get("step_zones", [])
-    st.session_state._w_interval_variable_step = bool(_isz)
+    _set_widget("_w_interval_variable_step", bool(_isz))
     if _isz:
         z1 = _isz[0] if len(_isz) >= 1 else [None, None]
-        st.session_state._w_interval_step_zone1_boundary = (
+        _set_widget("_w_interval_step_zone1_boundary",
             format_si(z1[0]) if z1[0] is not None else "")
-        st.session_state._w_interval_step_zone1_step = (
+        _set_widget("_w_interval_step_zone1_step",
             format_si(z1[1]) if z1[1] is not None else "")
         z2 = _isz[1] if len(_isz) >= 2 else [None, None]
-        st.session_state._w_interval_step_zone2_boundary = (
+        _set_widget("_w_interval_step_zone2_boundary",
             format_si(z2[0]) if z2[0] is not None else "")
-        st.session_state._w_interval_step_zone2_step = (
+        _set_widget("_w_interval_step_zone2_step",
             format_si(z2[1]) if z2[1] is not None else "")
-    st.session_state._is_sync_mode = (
+    _set_widget("_is_sync_mode",
         "Step-Synced" if isw.get("sync_mode", "ramp") == "step_synced" else "Ramp Detection")
 
     # Interval Sweep - Integration / Step-Sync (duplicated widgets)
-    st.session_state._w_is_ig_dmm_address = ig.get("dmm_visa_address", DEFAULT_34401A_ADDRESS)
-    st.session_state._w_is_ig_poll_interval = ig.get("poll_interval", 1.0)
-    st.session_state._w_is_ig_num_cycles = ig.get("num_cycles", 0)
-    st.session_state._w_is_ig_trigger_start = ig.get("trigger_start_voltage", -9.8)
-    st.session_state._w_is_ig_trigger_end = ig.get("trigger_end_voltage", -9.2)
-    st.session_state._w_is_ig_sweep_start = ig.get("sweep_start_voltage", -9.0)
-    st.session_state._is_ss_total_steps = int(ss.get("total_steps", 30))
-    st.session_state._is_ss_sweep_start_step = int(ss.get("sweep_start_step", 10))
-    st.session_state._is_ss_confirm_reads = int(ss.get("confirm_reads", 2))
-    st.session_state._is_ss_v_start = ss.get("v_start", -10.0)
-    st.session_state._is_ss_v_stop = ss.get("v_stop", 10.0)
-    st.session_state._is_ss_poll_interval = ss.get("poll_interval", 0.1)
-    st.session_state._is_ss_step_timeout = ss.get("step_timeout", 10.0)
-    st.session_state._is_ss_restart_voltage = ss.get("restart_voltage", -9.5)
-    st.session_state._is_ss_restart_timeout = ss.get("restart_timeout", 60.0)
+    _set_widget("_w_is_ig_dmm_address", ig.get("dmm_visa_address", DEFAULT_34401A_ADDRESS))
+    _set_widget("_w_is_ig_poll_interval", ig.get("poll_interval", 1.0))
+    _set_widget("_w_is_ig_num_cycles", ig.get("num_cycles", 0))
+    _set_widget("_w_is_ig_trigger_start", ig.get("trigger_start_voltage", -9.8))
+    _set_widget("_w_is_ig_trigger_end", ig.get("trigger_end_voltage", -9.2))
+    _set_widget("_w_is_ig_sweep_start", ig.get("sweep_start_voltage", -9.0))
+    _set_widget("_is_ss_total_steps", int(ss.get("total_steps", 30)))
+    _set_widget("_is_ss_sweep_start_step", int(ss.get("sweep_start_step", 10)))
+    _set_widget("_is_ss_confirm_reads", int(ss.get("confirm_reads", 2)))
+    _set_widget("_is_ss_v_start", ss.get("v_start", -10.0))
+    _set_widget("_is_ss_v_stop", ss.get("v_stop", 10.0))
+    _set_widget("_is_ss_poll_interval", ss.get("poll_interval", 0.1))
+    _set_widget("_is_ss_step_timeout", ss.get("step_timeout", 10.0))
+    _set_widget("_is_ss_restart_voltage", ss.get("restart_voltage", -9.5))
+    _set_widget("_is_ss_restart_timeout", ss.get("restart_timeout", 60.0))
 
 
 # Process pending import BEFORE any widgets are instantiated
@@ -399,41 +599,83 @@ if "_pending_import" in st.session_state:
 # ================================================================== #
 #  Instrument helpers
 # ================================================================== #
-def _close_live_connection() -> None:
-    """Close the live connection and reset associated state."""
-    inst = st.session_state.pop("live_instrument", None)
+def _instrument_pool() -> dict[str, PulseInstrument]:
+    """This browser session's open AWG connections keyed by VISA address.
+
+    Kept in session state rather than st.cache_resource: each session runs its script on
+    one thread at a time, so SCPI sequences on a handle never interleave, and Reset or
+    Disconnect only close this session's connections.
+    """
+    return st.session_state.setdefault("_instrument_pool", {})
+
+
+def _get_instrument(visa_address: str) -> PulseInstrument:
+    """Return the shared connection for *visa_address*, opening it on first use."""
+    pool = _instrument_pool()
+    inst = pool.get(visa_address)
+    if inst is None:
+        inst = PulseInstrument(visa_address)
+        pool[visa_address] = inst
+    return inst
+
+
+def _release_instrument(visa_address: str) -> None:
+    """Close and forget the shared connection for *visa_address* (if any).
+
+    Live mode borrows the pooled handle, so it is left as well when that handle goes away.
+    """
+    inst = _instrument_pool().pop(visa_address, None)
     if inst is not None:
+        if st.session_state.get("live_instrument") is inst:
+            _close_live_connection()
+            st.session_state._w_live_connection = False
         try:
             inst.close()
         except Exception:
             pass
+
+
+def _close_live_connection() -> None:
+    """Leave live mode and reset associated state.
+
+    The live handle is borrowed from the shared pool, so it stays open for the next
+    start/sweep; the sidebar "Disconnect" button is what actually closes it.
+    """
+    st.session_state.pop("live_instrument", None)
     st.session_state.live_connection = False
     st.session_state.pop("last_trigger_delay", None)
     logger.info("Live connection closed")
 
 
+def _on_visa_address_change() -> None:
+    """VISA address edited -> close pooled connections to every other address."""
+    new_addr = st.session_state._w_visa_address
+    for addr in list(_instrument_pool()):
+        if addr != new_addr:
+            _release_instrument(addr)
+            logger.info("Released connection to previous address: %s", addr)
+
+
 def _pulse_start(config: PulseConfig, channel: int) -> None:
-    """Start pulse output. Reuses live connection if active, otherwise fire-and-forget."""
+    """Start pulse output. Reuses live connection if active, otherwise the shared one."""
     if st.session_state.get("live_connection"):
         inst = st.session_state.get("live_instrument")
         if inst is None:
-            inst = PulseInstrument(config.visa_address)
+            inst = _get_instrument(config.visa_address)
             st.session_state.live_instrument = inst
-        close_after = False
+        shared = False
     else:
-        inst = PulseInstrument(config.visa_address)
-        close_after = True
+        inst = _get_instrument(config.visa_address)
+        shared = True
 
     try:
         inst.setup_arbitrary(config, [config.pulse_width], channel=channel)
     except Exception:
-        if close_after:
-            inst.close()
+        if shared:
+            _release_instrument(config.visa_address)
         raise
 
-    if close_after:
-        inst.close()
-    else:
+    if not shared:
         st.session_state.last_trigger_delay = config.trigger_delay
 
 
@@ -442,61 +684,53 @@ def _pump_probe_start(config: PumpProbeConfig, channel: int) -> None:
     if st.session_state.get("live_connection"):
         inst = st.session_state.get("live_instrument")
         if inst is None:
-            inst = PulseInstrument(config.visa_address)
+            inst = _get_instrument(config.visa_address)
             st.session_state.live_instrument = inst
-        close_after = False
+        shared = False
     else:
-        inst = PulseInstrument(config.visa_address)
-        close_after = True
+        inst = _get_instrument(config.visa_address)
+        shared = True
 
     try:
         inst.setup_pump_probe_arbitrary(
             config, config.pulse_width, [config.pulse_interval], channel=channel,
         )
     except Exception:
-        if close_after:
-            inst.close()
+        if shared:
+            _release_instrument(config.visa_address)
         raise
 
-    if close_after:
-        inst.close()
-    else:
+    if not shared:
         st.session_state.last_trigger_delay = config.trigger_delay
 
 
 def _pulse_stop(visa_addr: str, channel: int) -> None:
-    """Stop pulse output. Reuses live connection if active, otherwise fire-and-forget."""
-    if st.session_state.get("live_connection"):
-        inst = st.session_state.get("live_instrument")
-        if inst is not None:
-            inst.teardown(channel=channel)
-        else:
-            tmp = PulseInstrument(visa_addr)
-            try:
-                tmp.teardown(channel=channel)
-            finally:
-                tmp.close()
+    """Stop pulse output. Reuses live connection if active, otherwise the shared one."""
+    state = st.session_state
+    is_live = state.get("live_connection", False)
+    inst = state.get("live_instrument") if is_live else None
+    if inst is not None:
+        inst.teardown(channel=channel)
     else:
-        tmp = PulseInstrument(visa_addr)
         try:
-            tmp.teardown(channel=channel)
-        finally:
-            tmp.close()
+            _get_instrument(visa_addr).teardown(channel=channel)
+        except Exception:
+            _release_instrument(visa_addr)
+            raise
 
-    st.session_state[f"ch{channel}_running"] = False
+    state[f"ch{channel}_running"] = False
 
     # Auto-OFF live connection when all channels become idle
     # Check both Simple Pulse and Pump-Probe running states
     any_running = (
-        st.session_state.get("ch1_running")
-        or st.session_state.get("ch2_running")
-        or st.session_state.get("pp_ch1_running")
-        or st.session_state.get("pp_ch2_running")
+        state.get("ch1_running")
+        or state.get("ch2_running")
+        or state.get("pp_ch1_running")
+        or state.get("pp_ch2_running")
     )
-    if not any_running:
-        if st.session_state.get("live_connection"):
-            _close_live_connection()
-            st.session_state._w_live_connection = False
+    if not any_running and is_live:
+        _close_live_connection()
+        state._w_live_connection = False
 
 
 # ================================================================== #
@@ -511,15 +745,26 @@ with st.sidebar:
     visa_address = st.text_input(
         "VISA Address",
         key="_w_visa_address",
+        on_change=_on_visa_address_change,
     )
 
-    btn_col1, btn_col2 = st.columns(2)
+    btn_col1, btn_col2, btn_col3 = st.columns(3)
     with btn_col1:
         if st.button("Reset", use_container_width=True):
+            for _addr in list(_instrument_pool()):
+                _release_instrument(_addr)
             st.session_state._w_visa_address = DEFAULT_VISA_ADDRESS
             st.rerun()
     with btn_col2:
         check_conn = st.button("Check", use_container_width=True)
+    with btn_col3:
+        # Sweeps keep the shared connection open between runs; this closes it
+        if st.button("Disconnect", use_container_width=True):
+            if st.session_state.get("live_connection"):
+                _close_live_connection()
+                st.session_state._w_live_connection = False
+            _release_instrument(visa_address)
+            logger.info("Disconnected: %s", visa_address)
 
     if check_conn:
         if st.session_state.get("live_connection"):
@@ -527,7 +772,9 @@ with st.sidebar:
             st.session_state._w_live_connection = False
         with st.spinner("Connecting..."):
             try:
-                idn = PulseInstrument.check_connection(visa_address)
+                # Reconnect from scratch and keep the fresh handle for later actions
+                _release_instrument(visa_address)
+                idn = _get_instrument(visa_address).idn
                 st.success(f"OK: {idn}")
                 logger.info("Connection check OK: %s", idn)
             except Exception as exc:
@@ -541,11 +788,11 @@ with st.sidebar:
             st.session_state._w_live_connection = False
         with st.spinner("Setting DC 0V..."):
             try:
-                inst = PulseInstrument(visa_address)
                 try:
-                    inst.set_dc_zero()
-                finally:
-                    inst.close()
+                    _get_instrument(visa_address).set_dc_zero()
+                except Exception:
+                    _release_instrument(visa_address)
+                    raise
                 st.success("DC 0V set")
                 logger.info("DC 0V set via UI")
             except Exception as exc:
@@ -571,14 +818,12 @@ with st.sidebar:
             upload_id = f"{uploaded.name}_{uploaded.size}"
             if st.session_state.get("_last_upload_id") != upload_id:
                 st.session_state._last_upload_id = upload_id
-                with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as tmp:
-                    tmp.write(uploaded.read())
-                    tmp.flush()
-                    try:
-                        st.session_state._pending_import = load_unified_toml(tmp.name)
-                        st.rerun()
-                    except Exception as exc:
-                        st.error(f"Import failed: {exc}")
+                try:
+                    logger.info("Importing unified TOML: %s", uploaded.name)
+                    st.session_state._pending_import = _parse_uploaded_config(uploaded.getvalue())
+                    st.rerun()
+                except Exception as exc:
+                    st.error(f"Import failed: {exc}")
 
     _save_btn_placeholder = st.empty()
 
@@ -601,17 +846,20 @@ with col_left:
         v_off = st.number_input(
             "V_off [V]", format="%.4f", key="_w_v_off",
         )
+    # Defaults are only needed on first render; afterwards the on_change
+    # callbacks (and config import) keep both fields in sync.
+    if "_w_freq" not in st.session_state:
+        _freq_default = _common.get("frequency", 10_000_000.0)
+        st.session_state._w_freq = format_si(_freq_default)
+        st.session_state.setdefault("_w_period", _period_text_for(_freq_default))
     freq_col, period_col = st.columns(2)
     with freq_col:
-        st.session_state.setdefault("_w_freq", format_si(_common.get("frequency", 10_000_000.0)))
         st.text_input(
             "Frequency [Hz]",
             key="_w_freq",
             on_change=_on_freq_change,
         )
     with period_col:
-        _freq_default = _common.get("frequency", 10_000_000.0)
-        st.session_state.setdefault("_w_period", format_si(1.0 / _freq_default) if _freq_default > 0 else "0")
         st.text_input(
             "Period [s]",
             key="_w_period",
@@ -621,20 +869,21 @@ with col_left:
 with col_right:
     st.text("Trigger Delay")
     st.session_state.setdefault("_w_trigger_delay", _common.get("trigger_delay", 0))
-    trigger_delay = st.number_input(
+    # Normalized to int once here; everything below uses the values as-is
+    trigger_delay = int(st.number_input(
         "Trigger Delay [points] (multiple of 8)",
         min_value=0, step=8,
         key="_w_trigger_delay",
-    )
+    ))
     col_res_n, col_res_val = st.columns(2)
     with col_res_n:
         st.session_state.setdefault("_w_resolution_n", _common.get("resolution_n", 1))
-        resolution_n = st.number_input(
+        resolution_n = int(st.number_input(
             "Delay Resolution (×n)",
             min_value=1, step=1,
             help="Multiplier for points_per_period. Higher = finer delay resolution.",
             key="_w_resolution_n",
-        )
+        ))
     with col_res_val:
         _delay_res_placeholder = st.empty()
 
@@ -676,6 +925,12 @@ tab_pulse, tab_pp, tab_sweep, tab_isweep, tab_delay = st.tabs([
 #  Simple Pulse tab
 # ================================================================== #
 with tab_pulse:
+    # Read per-rerun run/live state once; the branches below only use these locals
+    ch1_running = st.session_state.get("ch1_running", False)
+    ch2_running = st.session_state.get("ch2_running", False)
+    is_live = st.session_state.get("live_connection", False)
+    live_inst = st.session_state.get("live_instrument") if is_live else None
+
     if _active_output_tab is not None and _active_output_tab != "simple_pulse":
         _mode_label = "Simple Pulse" if _sp_running else "Pump-Probe"
         _chs = [str(ch) for ch in [1, 2]
@@ -689,7 +944,7 @@ with tab_pulse:
         _pulse_left, _pulse_right = st.columns([2, 1])
 
         with _pulse_left:
-            st.session_state.setdefault("_w_pulse_width", format_si(_sp.get("pulse_width", 1e-8)))
+            _default_si("_w_pulse_width", _sp.get("pulse_width", 1e-8))
             st.text_input(
                 "Pulse Width [s]",
                 key="_w_pulse_width",
@@ -698,31 +953,32 @@ with tab_pulse:
 
             # Parse pulse-specific fields
             pulse_parse_errors = list(common_parse_errors)
-            try:
-                pulse_width_val = parse_si(st.session_state._w_pulse_width)
-            except (ValueError, KeyError):
-                pulse_width_val = None
-                pulse_parse_errors.append(
-                    f"pulse_width: invalid value \"{st.session_state.get('_w_pulse_width', '')}\""
-                )
+            pulse_parsed: dict[str, float] = {}
+            _state = st.session_state
+            for name, key in _PULSE_SI_FIELDS:
+                try:
+                    pulse_parsed[name] = parse_si(_state[key])
+                except (ValueError, KeyError):
+                    pulse_parse_errors.append(
+                        f"{name}: invalid value \"{_state.get(key, '')}\""
+                    )
 
             # Build pulse config
-            if not pulse_parse_errors and pulse_width_val is not None:
+            if not pulse_parse_errors:
                 pulse_config = PulseConfig(
                     visa_address=visa_address,
                     v_on=v_on,
                     v_off=v_off,
                     frequency=common_parsed["frequency"],
-                    trigger_delay=int(trigger_delay),
-                    resolution_n=int(resolution_n),
-                    pulse_width=pulse_width_val,
+                    trigger_delay=trigger_delay,
+                    resolution_n=resolution_n,
+                    pulse_width=pulse_parsed["pulse_width"],
                     waveform_mode=pulse_waveform_mode,
                 )
 
             # Validation
-            errors_pulse = list(pulse_parse_errors)
-            if pulse_config is not None:
-                errors_pulse.extend(pulse_config.validate())
+            # Configs are only built without parse errors, so validate() covers the rest
+            errors_pulse = pulse_parse_errors if pulse_config is None else pulse_config.validate()
 
             if errors_pulse:
                 st.error("Configuration error:\n" + "\n".join(f"- {e}" for e in errors_pulse))
@@ -732,15 +988,12 @@ with tab_pulse:
                     _show_arb_info(pulse_config.frequency, [pulse_config.pulse_width], resolution_n=resolution_n)
 
             # Per-channel toggle + Live toggle
-            ch1_running = st.session_state.get("ch1_running", False)
-            ch2_running = st.session_state.get("ch2_running", False)
             can_start = not bool(errors_pulse) and bool(visa_address)
 
             btn_ch1 = False
             btn_ch2 = False
             live_on = False
             live_off = False
-            is_live = st.session_state.get("live_connection", False)
 
             c1, c2, c3 = st.columns(3)
             with c1:
@@ -769,7 +1022,7 @@ with tab_pulse:
                     )
 
             # Status
-            if st.session_state.get("live_connection"):
+            if is_live:
                 st.warning("Live Connection: ON (front panel locked in REMOTE mode)")
             if ch1_running:
                 st.info("CH1: Pulse output is ON.")
@@ -789,9 +1042,10 @@ with tab_pulse:
             if _btn_save:
                 pw = st.session_state.get("_w_pulse_width", "")
                 new_record = {
-                    "timestamp": datetime.now().strftime("%H:%M:%S"),
+                    "timestamp": time.strftime("%H:%M:%S"),
                     "pulse_width": pw,
-                    "trigger_delay": int(trigger_delay),
+                    "pulse_width_s": parse_si(pw),
+                    "trigger_delay": trigger_delay,
                 }
                 records = st.session_state.saved_pulse_records
                 # Overwrite if same pulse_width exists
@@ -804,7 +1058,7 @@ with tab_pulse:
                 if not replaced:
                     records.append(new_record)
                 # Sort by pulse_width
-                records.sort(key=lambda r: parse_si(r["pulse_width"]))
+                records.sort(key=lambda r: r["pulse_width_s"])
                 _save_records_to_csv(records)
                 st.rerun()
 
@@ -814,58 +1068,41 @@ with tab_pulse:
                 st.rerun()
 
             if st.session_state.saved_pulse_records:
-                lines = ["timestamp,pulse_width,trigger_delay"]
-                for r in st.session_state.saved_pulse_records:
-                    lines.append(f"{r['timestamp']},{r['pulse_width']},{r['trigger_delay']}")
-                st.markdown("```csv\n" + "\n".join(lines) + "\n```")
-
-        # CH1 toggle
-        if btn_ch1:
-            if ch1_running:
-                try:
-                    _pulse_stop(visa_address, channel=1)
-                except Exception as exc:
-                    logger.error("Teardown CH1 error: %s", exc)
-                logger.info("Pulse CH1 stopped via UI")
-                st.rerun()
-            elif pulse_config is not None:
-                try:
-                    _pulse_start(pulse_config, channel=1)
-                    st.session_state.ch1_running = True
-                    logger.info("Pulse CH1 started via UI (%s)", pulse_config.waveform_mode)
-                    st.rerun()
-                except Exception as exc:
-                    st.error(f"Error: {exc}")
-                    logger.exception("Error starting pulse CH1")
+                st.dataframe(
+                    _records_columns(st.session_state.saved_pulse_records, "pulse_width"),
+                    hide_index=True, use_container_width=True,
+                )
 
-        # CH2 toggle
-        if btn_ch2:
-            if ch2_running:
+        # CH1/CH2 toggles
+        for ch_num, btn, running in ((1, btn_ch1, ch1_running), (2, btn_ch2, ch2_running)):
+            if not btn:
+                continue
+            if running:
                 try:
-                    _pulse_stop(visa_address, channel=2)
+                    _pulse_stop(visa_address, channel=ch_num)
                 except Exception as exc:
-                    logger.error("Teardown CH2 error: %s", exc)
-                logger.info("Pulse CH2 stopped via UI")
+                    logger.error("Teardown CH%d error: %s", ch_num, exc)
+                logger.info("Pulse CH%d stopped via UI", ch_num)
                 st.rerun()
             elif pulse_config is not None:
                 try:
-                    _pulse_start(pulse_config, channel=2)
-                    st.session_state.ch2_running = True
-                    logger.info("Pulse CH2 started via UI (%s)", pulse_config.waveform_mode)
+                    _pulse_start(pulse_config, channel=ch_num)
+                    st.session_state[f"ch{ch_num}_running"] = True
+                    logger.info("Pulse CH%d started via UI (%s)", ch_num, pulse_config.waveform_mode)
                     st.rerun()
                 except Exception as exc:
                     st.error(f"Error: {exc}")
-                    logger.exception("Error starting pulse CH2")
+                    logger.exception("Error starting pulse CH%d", ch_num)
 
         # Live connection state management (button-driven)
         if live_on:
             try:
-                inst = PulseInstrument(visa_address)
+                inst = _get_instrument(visa_address)
                 st.session_state.live_instrument = inst
                 st.session_state.live_connection = True
-                delay_val = int(trigger_delay)
-                for ch_num in [1, 2]:
-                    if st.session_state.get(f"ch{ch_num}_running"):
+                delay_val = trigger_delay
+                for ch_num, running in ((1, ch1_running), (2, ch2_running)):
+                    if running:
                         inst.set_trigger_delay(delay_val, channel=ch_num)
                 st.session_state.last_trigger_delay = delay_val
                 logger.info("Live connection opened")
@@ -874,27 +1111,28 @@ with tab_pulse:
                 st.error(f"Live connection failed: {exc}")
                 st.session_state.live_connection = False
                 logger.exception("Live connection error")
+                _release_instrument(visa_address)
 
         if live_off:
             _close_live_connection()
             st.rerun()
 
         if is_live and not live_off:
-            delay_val = int(trigger_delay)
+            delay_val = trigger_delay
             prev_delay = st.session_state.get("last_trigger_delay")
             if prev_delay is not None and delay_val != prev_delay:
-                inst = st.session_state.get("live_instrument")
-                if inst is not None:
+                if live_inst is not None:
                     try:
-                        for ch_num in [1, 2]:
-                            if st.session_state.get(f"ch{ch_num}_running"):
-                                inst.set_trigger_delay(delay_val, channel=ch_num)
+                        for ch_num, running in ((1, ch1_running), (2, ch2_running)):
+                            if running:
+                                live_inst.set_trigger_delay(delay_val, channel=ch_num)
                         st.session_state.last_trigger_delay = delay_val
                         logger.info("Live: trigger delay updated to %d", delay_val)
                     except Exception as exc:
                         st.error(f"Failed to update trigger delay: {exc}")
                         logger.exception("Live trigger delay update error")
                         _close_live_connection()
+                        _release_instrument(visa_address)
 
 # ================================================================== #
 #  Pump-Probe tab
@@ -913,12 +1151,12 @@ with tab_pp:
         _pp_left, _pp_right = st.columns([2, 1])
 
         with _pp_left:
-            st.session_state.setdefault("_w_pp_pulse_width", format_si(_pp.get("pulse_width", 1e-8)))
+            _default_si("_w_pp_pulse_width", _pp.get("pulse_width", 1e-8))
             st.text_input(
                 "Pulse Width [s]",
                 key="_w_pp_pulse_width",
             )
-            st.session_state.setdefault("_w_pp_pulse_interval", format_si(_pp.get("pulse_interval", 2e-8)))
+            _default_si("_w_pp_pulse_interval", _pp.get("pulse_interval", 2e-8))
             st.text_input(
                 "Pulse Interval [s]",
                 key="_w_pp_pulse_interval",
@@ -926,37 +1164,30 @@ with tab_pp:
 
             # Parse pump-probe specific fields
             pp_parse_errors = list(common_parse_errors)
-            pp_pulse_width_val: float | None = None
-            pp_pulse_interval_val: float | None = None
-            try:
-                pp_pulse_width_val = parse_si(st.session_state._w_pp_pulse_width)
-            except (ValueError, KeyError):
-                pp_parse_errors.append(
-                    f"pulse_width: invalid value \"{st.session_state.get('_w_pp_pulse_width', '')}\""
-                )
-            try:
-                pp_pulse_interval_val = parse_si(st.session_state._w_pp_pulse_interval)
-            except (ValueError, KeyError):
-                pp_parse_errors.append(
-                    f"pulse_interval: invalid value \"{st.session_state.get('_w_pp_pulse_interval', '')}\""
-                )
+            pp_parsed: dict[str, float] = {}
+            _state = st.session_state
+            for name, key in _PP_SI_FIELDS:
+                try:
+                    pp_parsed[name] = parse_si(_state[key])
+                except (ValueError, KeyError):
+                    pp_parse_errors.append(
+                        f"{name}: invalid value \"{_state.get(key, '')}\""
+                    )
 
             pp_config: PumpProbeConfig | None = None
-            if not pp_parse_errors and pp_pulse_width_val is not None and pp_pulse_interval_val is not None:
+            if not pp_parse_errors:
                 pp_config = PumpProbeConfig(
                     visa_address=visa_address,
                     v_on=v_on,
                     v_off=v_off,
                     frequency=common_parsed["frequency"],
-                    trigger_delay=int(trigger_delay),
-                    resolution_n=int(resolution_n),
-                    pulse_width=pp_pulse_width_val,
-                    pulse_interval=pp_pulse_interval_val,
+                    trigger_delay=trigger_delay,
+                    resolution_n=resolution_n,
+                    pulse_width=pp_parsed["pulse_width"],
+                    pulse_interval=pp_parsed["pulse_interval"],
                 )
 
-            errors_pp = list(pp_parse_errors)
-            if pp_config is not None:
-                errors_pp.extend(pp_config.validate())
+            errors_pp = pp_parse_errors if pp_config is None else pp_config.validate()
 
             if errors_pp:
                 st.error("Configuration error:\n" + "\n".join(f"- {e}" for e in errors_pp))
@@ -1021,9 +1252,10 @@ with tab_pp:
             if _pp_btn_save:
                 iv = st.session_state.get("_w_pp_pulse_interval", "")
                 new_record = {
-                    "timestamp": datetime.now().strftime("%H:%M:%S"),
+                    "timestamp": time.strftime("%H:%M:%S"),
                     "pulse_interval": iv,
-                    "trigger_delay": int(trigger_delay),
+                    "pulse_interval_s": parse_si(iv),
+                    "trigger_delay": trigger_delay,
                 }
                 records = st.session_state.saved_pp_records
                 replaced = False
@@ -1034,7 +1266,7 @@ with tab_pp:
                         break
                 if not replaced:
                     records.append(new_record)
-                records.sort(key=lambda r: parse_si(r["pulse_interval"]))
+                records.sort(key=lambda r: r["pulse_interval_s"])
                 _save_pp_records_to_csv(records)
                 st.rerun()
 
@@ -1044,58 +1276,40 @@ with tab_pp:
                 st.rerun()
 
             if st.session_state.saved_pp_records:
-                lines = ["timestamp,pulse_interval,trigger_delay"]
-                for r in st.session_state.saved_pp_records:
-                    lines.append(f"{r['timestamp']},{r['pulse_interval']},{r['trigger_delay']}")
-                st.markdown("```csv\n" + "\n".join(lines) + "\n```")
-
-        # CH1 toggle (pump-probe)
-        if pp_btn_ch1:
-            if pp_ch1_running:
-                st.session_state.pp_ch1_running = False
-                try:
-                    _pulse_stop(visa_address, channel=1)
-                except Exception as exc:
-                    logger.error("Teardown CH1 error: %s", exc)
-                logger.info("Pump-probe CH1 stopped via UI")
-                st.rerun()
-            elif pp_config is not None:
-                try:
-                    _pump_probe_start(pp_config, channel=1)
-                    st.session_state.pp_ch1_running = True
-                    logger.info("Pump-probe CH1 started via UI")
-                    st.rerun()
-                except Exception as exc:
-                    st.error(f"Error: {exc}")
-                    logger.exception("Error starting pump-probe CH1")
+                st.dataframe(
+                    _records_columns(st.session_state.saved_pp_records, "pulse_interval"),
+                    hide_index=True, use_container_width=True,
+                )
 
-        # CH2 toggle (pump-probe)
-        if pp_btn_ch2:
-            if pp_ch2_running:
-                st.session_state.pp_ch2_running = False
+        # CH1/CH2 toggles (pump-probe)
+        for ch_num, btn, running in ((1, pp_btn_ch1, pp_ch1_running), (2, pp_btn_ch2, pp_ch2_running)):
+            if not btn:
+                continue
+            if running:
+                st.session_state[f"pp_ch{ch_num}_running"] = False
                 try:
-                    _pulse_stop(visa_address, channel=2)
+                    _pulse_stop(visa_address, channel=ch_num)
                 except Exception as exc:
-                    logger.error("Teardown CH2 error: %s", exc)
-                logger.info("Pump-probe CH2 stopped via UI")
+                    logger.error("Teardown CH%d error: %s", ch_num, exc)
+                logger.info("Pump-probe CH%d stopped via UI", ch_num)
                 st.rerun()
             elif pp_config is not None:
                 try:
-                    _pump_probe_start(pp_config, channel=2)
-                    st.session_state.pp_ch2_running = True
-                    logger.info("Pump-probe CH2 started via UI")
+                    _pump_probe_start(pp_config, channel=ch_num)
+                    st.session_state[f"pp_ch{ch_num}_running"] = True
+                    logger.info("Pump-probe CH%d started via UI", ch_num)
                     st.rerun()
                 except Exception as exc:
                     st.error(f"Error: {exc}")
-                    logger.exception("Error starting pump-probe CH2")
+                    logger.exception("Error starting pump-probe CH%d", ch_num)
 
         # Live connection (pump-probe tab)
         if pp_live_on:
             try:
-                inst = PulseInstrument(visa_address)
+                inst = _get_instrument(visa_address)
                 st.session_state.live_instrument = inst
                 st.session_state.live_connection = True
-                delay_val = int(trigger_delay)
+                delay_val = trigger_delay
                 for ch_num in [1, 2]:
                     if st.session_state.get(f"pp_ch{ch_num}_running"):
                         inst.set_trigger_delay(delay_val, channel=ch_num)
@@ -1106,6 +1320,7 @@ with tab_pp:
                 st.error(f"Live connection failed: {exc}")
                 st.session_state.live_connection = False
                 logger.exception("Live connection error")
+                _release_instrument(visa_address)
 
         if pp_live_off:
             _close_live_connection()
@@ -1113,7 +1328,7 @@ with tab_pp:
 
         # Live trigger delay update (pump-probe tab)
         if pp_is_live and not pp_live_off:
-            delay_val = int(trigger_delay)
+            delay_val = trigger_delay
             prev_delay = st.session_state.get("last_trigger_delay")
             if prev_delay is not None and delay_val != prev_delay:
                 inst = st.session_state.get("live_instrument")
@@ -1128,6 +1343,7 @@ with tab_pp:
                         st.error(f"Failed to update trigger delay: {exc}")
                         logger.exception("Live trigger delay update error (PP)")
                         _close_live_connection()
+                        _release_instrument(visa_address)
 
 # ================================================================== #
 #  Width Sweep tab
@@ -1146,17 +1362,17 @@ with tab_sweep:
         col_range, col_timing, col_opts = st.columns(3)
 
         with col_range:
-            st.session_state.setdefault("_w_width_start", format_si(_ws.get("width_start", 1e-8)))
+            _default_si("_w_width_start", _ws.get("width_start", 1e-8))
             st.text_input(
                 "Width Start [s]",
                 key="_w_width_start",
             )
-            st.session_state.setdefault("_w_width_stop", format_si(_ws.get("width_stop", 5e-8)))
+            _default_si("_w_width_stop", _ws.get("width_stop", 5e-8))
             st.text_input(
                 "Width Stop [s]",
                 key="_w_width_stop",
             )
-            st.session_state.setdefault("_w_width_step", format_si(_ws.get("width_step", 5e-9)))
+            _default_si("_w_width_step", _ws.get("width_step", 5e-9))
             st.text_input(
                 "Width Step [s]",
                 key="_w_width_step",
@@ -1184,27 +1400,27 @@ with tab_sweep:
                 with st.expander(_exp_title, expanded=True):
                     _zc1, _zc2 = st.columns(2)
                     with _zc1:
-                        st.session_state.setdefault("_w_step_zone1_boundary", format_si(_z1[0]) if _z1[0] is not None else "")
+                        _default_si("_w_step_zone1_boundary", _z1[0])
                         st.text_input(
                             "Zone 1: width ≤ [s]",
                             key="_w_step_zone1_boundary",
                         )
                     with _zc2:
-                        st.session_state.setdefault("_w_step_zone1_step", format_si(_z1[1]) if _z1[1] is not None else "")
+                        _default_si("_w_step_zone1_step", _z1[1])
                         st.text_input(
                             "Zone 1 step [s]",
                             key="_w_step_zone1_step",
                         )
                     _zc3, _zc4 = st.columns(2)
                     with _zc3:
-                        st.session_state.setdefault("_w_step_zone2_boundary", format_si(_z2[0]) if _z2[0] is not None else "")
+                        _default_si("_w_step_zone2_boundary", _z2[0])
                         st.text_input(
                             "Zone 2: width ≤ [s]",
                             key="_w_step_zone2_boundary",
                             help="Leave blank if only 1 zone boundary needed",
                         )
                     with _zc4:
-                        st.session_state.setdefault("_w_step_zone2_step", format_si(_z2[1]) if _z2[1] is not None else "")
+                        _default_si("_w_step_zone2_step", _z2[1])
                         st.text_input(
                             "Zone 2 step [s]",
                             key="_w_step_zone2_step",
@@ -1212,7 +1428,7 @@ with tab_sweep:
                     st.caption("Above last boundary → uses Width Step as default step")
 
         with col_timing:
-            st.session_state.setdefault("_w_wait_time", format_si(_ws.get("wait_time", 1.0)))
+            _default_si("_w_wait_time", _ws.get("wait_time", 1.0))
             st.text_input(
                 "Wait Time [s]",
                 key="_w_wait_time",
@@ -1230,15 +1446,13 @@ with tab_sweep:
 
         waveform_mode = "arbitrary"
         with col_opts:
-            st.session_state.setdefault("_w_delay_mode_radio",
-                "Table" if _ws.get("delay_mode", "exponent") == "table" else "Exponent")
-            delay_mode = st.radio(
-                "Delay Mode", ["Exponent", "Table"],
+            st.session_state.setdefault("_w_delay_mode_radio", _delay_mode_of(_ws))
+            _delay_mode_val = st.radio(
+                "Delay Mode", _DELAY_MODES, format_func=str.title,
                 horizontal=True, key="_w_delay_mode_radio",
             )
-            _delay_mode_val = "exponent" if delay_mode == "Exponent" else "table"
 
-            if _delay_mode_val == "exponent":
+            if _delay_mode_val == _DELAY_MODE_EXPONENT:
                 st.session_state.setdefault("_w_trigger_delay_stop", _ws.get("trigger_delay_stop", _common.get("trigger_delay", 0)))
                 sweep_trigger_delay_stop = st.number_input(
                     "Trigger Delay Stop [points] (×8)",
@@ -1255,7 +1469,7 @@ with tab_sweep:
                     key="_w_delay_exponent",
                 )
             else:
-                sweep_trigger_delay_stop = int(trigger_delay)  # not used in table mode
+                sweep_trigger_delay_stop = trigger_delay  # not used in table mode
                 delay_exponent = 1.0  # not used in table mode
                 records = st.session_state.get("saved_pulse_records", [])
                 if len(records) < 2:
@@ -1278,17 +1492,13 @@ with tab_sweep:
         sweep_parse_errors = list(common_parse_errors)
         sweep_parsed = dict(common_parsed)
 
-        for name, key in {
-            "width_start": "_w_width_start",
-            "width_stop": "_w_width_stop",
-            "width_step": "_w_width_step",
-            "wait_time": "_w_wait_time",
-        }.items():
+        _state = st.session_state
+        for name, key in _WIDTH_SWEEP_SI_FIELDS:
             try:
-                sweep_parsed[name] = parse_si(st.session_state[key])
+                sweep_parsed[name] = parse_si(_state[key])
             except (ValueError, KeyError):
                 sweep_parse_errors.append(
-                    f"{name}: invalid value \"{st.session_state.get(key, '')}\""
+                    f"{name}: invalid value \"{_state.get(key, '')}\""
                 )
 
         # Build step_zones from UI
@@ -1311,13 +1521,10 @@ with tab_sweep:
             _delay_stop_val = int(sweep_trigger_delay_stop)
             # Build delay_table from saved_pulse_records when in table mode
             _delay_table: list[tuple[float, int]] | None = None
-            if _delay_mode_val == "table":
+            if _delay_mode_val == _DELAY_MODE_TABLE:
                 _records = st.session_state.get("saved_pulse_records", [])
                 if _records:
-                    _delay_table = [
-                        (parse_si(r["pulse_width"]), int(r["trigger_delay"]))
-                        for r in _records
-                    ]
+                    _delay_table = _records_table(_records, "pulse_width")
             sweep_config_built = SweepConfig(
                 visa_address=visa_address,
                 v_on=v_on,
@@ -1326,12 +1533,12 @@ with tab_sweep:
                 width_stop=sweep_parsed["width_stop"],
                 width_step=sweep_parsed["width_step"],
                 frequency=sweep_parsed["frequency"],
-                trigger_delay=int(trigger_delay),
-                resolution_n=int(resolution_n),
+                trigger_delay=trigger_delay,
+                resolution_n=resolution_n,
                 wait_time=sweep_parsed["wait_time"],
                 waveform_mode=waveform_mode,
                 settling_time=sweep_settling_time,
-                trigger_delay_stop=_delay_stop_val if _delay_stop_val != int(trigger_delay) else None,
+                trigger_delay_stop=_delay_stop_val if _delay_stop_val != trigger_delay else None,
                 delay_exponent=delay_exponent,
                 delay_mode=_delay_mode_val,
                 delay_table=_delay_table,
@@ -1339,21 +1546,19 @@ with tab_sweep:
             )
 
         # Validation
-        errors_sweep = list(sweep_parse_errors)
-        if sweep_config_built is not None:
-            errors_sweep.extend(sweep_config_built.validate())
+        errors_sweep = sweep_parse_errors if sweep_config_built is None else sweep_config_built.validate()
 
         if errors_sweep:
             st.error("Configuration error:\n" + "\n".join(f"- {e}" for e in errors_sweep))
         else:
             st.success("Parameters OK")
             if sweep_config_built is not None:
-                widths = _generate_widths(
+                widths = list(_cached_widths(
                     sweep_config_built.width_start,
                     sweep_config_built.width_stop,
                     sweep_config_built.width_step,
-                    step_zones=sweep_config_built.step_zones,
-                )
+                    _zones_key(sweep_config_built.step_zones),
+                ))
                 _show_arb_info(sweep_config_built.frequency, widths, resolution_n=resolution_n)
 
         # Run sweep
@@ -1362,54 +1567,34 @@ with tab_sweep:
             config = sweep_config_built
             channels = _CHANNEL_MAP[sweep_channel]
             logger.info("Width sweep started (channels=%s)", channels)
-            progress = st.progress(0, text="Connecting...")
+            status = st.status("Width sweep", state="running", expanded=True)
+            progress = status.progress(0, text="Connecting...")
 
-            instrument = None
             try:
-                instrument = PulseInstrument(config.visa_address)
+                instrument = _get_instrument(config.visa_address)
                 progress.progress(0, text="Setting up instrument...")
 
-                widths = _generate_widths(
+                widths = list(_cached_widths(
                     config.width_start, config.width_stop, config.width_step,
-                    step_zones=config.step_zones,
-                )
+                    _zones_key(config.step_zones),
+                ))
 
+                @_throttled_progress
                 def on_upload(i: int, total: int) -> None:
                     progress.progress(
                         (i + 1) / total,
                         text=f"Uploading segments... [{i + 1}/{total}]",
                     )
 
-                for ch in channels:
-                    instrument.setup_arbitrary(
-                        config, widths, channel=ch, callback=on_upload,
-                    )
+                instrument.setup_arbitrary(
+                    config, widths, channels=channels, callback=on_upload,
+                )
 
                 # Settling phase
                 if config.settling_time > 0:
-                    t0 = time.time()
-                    while (elapsed := time.time() - t0) < config.settling_time:
-                        pct = elapsed / config.settling_time
-                        progress.progress(
-                            pct,
-                            text=f"Settling... {elapsed:.1f}s / {config.settling_time:.1f}s",
-                        )
-                        time.sleep(0.2)
+                    _wait_settling(progress, config.settling_time)
 
-                sweep_start = time.time()
-
-                def on_step(i: int, total: int) -> None:
-                    pct = (i + 1) / total
-                    elapsed = time.time() - sweep_start
-                    rate = (i + 1) / elapsed if elapsed > 0 else 0
-                    remaining = (total - i - 1) / rate if rate > 0 else 0
-                    progress.progress(
-                        pct,
-                        text=(
-                            f"Sweeping... {i + 1}/{total}"
-                            f" ({elapsed:.1f}s elapsed, ~{remaining:.0f}s remaining)"
-                        ),
-                    )
+                on_step = _sweep_progress(progress)
 
                 run_sweep(config, instrument, callback=on_step, channels=channels)
 
@@ -1417,14 +1602,19 @@ with tab_sweep:
                     instrument.teardown(channel=ch)
 
                 progress.progress(1.0, text="Done!")
+                status.update(label="Width sweep complete", state="complete")
                 logger.info("Width sweep completed")
 
             except Exception as exc:
                 st.error(f"Error: {exc}")
+                status.update(label="Width sweep failed", state="error")
                 logger.exception("Error during width sweep")
-            finally:
-                if instrument is not None:
-                    instrument.close()
+                # Connection state is unknown after a failure; reconnect on the next run
+                _release_instrument(config.visa_address)
+            except BaseException:
+                # Stopped mid-sweep (Stop / rerun): the session may be mid-transfer, so don't reuse it
+                _release_instrument(config.visa_address)
+                raise
 
         # ============================================================ #
         #  Auto Sweep (Voltage-Triggered Integration)
@@ -1574,12 +1764,11 @@ with tab_sweep:
                 voltage_display = st.empty()
                 progress = st.progress(0)
 
-                instrument = None
                 dmm = None
                 try:
                     # Connect AWG
                     phase_status.info("Connecting to AWG...")
-                    instrument = PulseInstrument(config.visa_address)
+                    instrument = _get_instrument(config.visa_address)
 
                     # Connect DMM
                     phase_status.info("Connecting to DMM...")
@@ -1587,31 +1776,24 @@ with tab_sweep:
                     dmm.configure_dc_voltage()
 
                     # Upload waveforms (once)
-                    widths = _generate_widths(
+                    widths = list(_cached_widths(
                         config.width_start, config.width_stop, config.width_step,
-                        step_zones=config.step_zones,
-                    )
+                        _zones_key(config.step_zones),
+                    ))
 
+                    @_throttled_progress
                     def on_auto_upload(i: int, total: int) -> None:
                         progress.progress(
                             (i + 1) / total,
                             text=f"Uploading segments... [{i + 1}/{total}]",
                         )
 
-                    for ch in channels:
-                        instrument.setup_arbitrary(config, widths, channel=ch, callback=on_auto_upload)
+                    instrument.setup_arbitrary(config, widths, channels=channels, callback=on_auto_upload)
 
                     # Settling phase (if configured)
                     if config.settling_time > 0:
                         phase_status.info("Settling...")
-                        t0 = time.time()
-                        while (elapsed := time.time() - t0) < config.settling_time:
-                            pct = elapsed / config.settling_time
-                            progress.progress(
-                                pct,
-                                text=f"Settling... {elapsed:.1f}s / {config.settling_time:.1f}s",
-                            )
-                            time.sleep(0.2)
+                        _wait_settling(progress, config.settling_time)
 
                     # Cycle loop
                     max_cycles = integration.num_cycles
@@ -1658,15 +1840,10 @@ with tab_sweep:
                         now = time.time()
                         wait_seconds = max(0.0, prediction.sweep_start_time - now)
                         if wait_seconds > 0:
-                            t0 = time.time()
-                            while (elapsed := time.time() - t0) < wait_seconds:
-                                pct = elapsed / wait_seconds
-                                remaining = wait_seconds - elapsed
-                                progress.progress(
-                                    pct,
-                                    text=f"Sweep starts in {remaining:.1f}s",
-                                )
-                                time.sleep(0.2)
+                            _wait_with_progress(
+                                progress, wait_seconds,
+                                lambda elapsed: f"Sweep starts in {wait_seconds - elapsed:.1f}s",
+                            )
 
                         # Restore USER mode before sweep (2nd cycle onward)
                         if cycle > 1:
@@ -1676,20 +1853,7 @@ with tab_sweep:
                         # Phase C: Sweep
                         phase_status.info(f"Sweeping (cycle {label})...")
                         voltage_display.empty()
-                        sweep_start = time.time()
-
-                        def on_auto_step(i: int, total: int) -> None:
-                            pct = (i + 1) / total
-                            elapsed = time.time() - sweep_start
-                            rate = (i + 1) / elapsed if elapsed > 0 else 0
-                            remaining = (total - i - 1) / rate if rate > 0 else 0
-                            progress.progress(
-                                pct,
-                                text=(
-                                    f"Sweeping... {i + 1}/{total}"
-                                    f" ({elapsed:.1f}s elapsed, ~{remaining:.0f}s remaining)"
-                                ),
-                            )
+                        on_auto_step = _sweep_progress(progress)
 
                         run_sweep(config, instrument, callback=on_auto_step, channels=channels)
                         logger.info("Auto sweep cycle %s complete", label)
@@ -1711,9 +1875,13 @@ with tab_sweep:
                 except Exception as exc:
                     st.error(f"Error: {exc}")
                     logger.exception("Error during auto sweep")
+                    # Connection state is unknown after a failure; reconnect on the next run
+                    _release_instrument(config.visa_address)
+                except BaseException:
+                    # Stopped mid-sweep (Stop / rerun): the session may be mid-transfer, so don't reuse it
+                    _release_instrument(config.visa_address)
+                    raise
                 finally:
-                    if instrument is not None:
-                        instrument.close()
                     if dmm is not None:
                         dmm.close()
 
@@ -1819,11 +1987,11 @@ with tab_sweep:
                 w_ss_errors = w_ss_config.validate()
 
                 # Check segment count fits
-                n_widths = len(_generate_widths(
+                n_widths = len(_cached_widths(
                     sweep_config_built.width_start,
                     sweep_config_built.width_stop,
                     sweep_config_built.width_step,
-                    step_zones=sweep_config_built.step_zones,
+                    _zones_key(sweep_config_built.step_zones),
                 ))
                 available = int(ss_total_steps) - int(ss_sweep_start_step)
                 if n_widths > available:
@@ -1865,31 +2033,30 @@ with tab_sweep:
                 voltage_display = st.empty()
                 progress = st.progress(0)
 
-                instrument = None
                 dmm = None
                 try:
                     phase_status.info("Connecting to AWG...")
-                    instrument = PulseInstrument(config.visa_address)
+                    instrument = _get_instrument(config.visa_address)
 
                     phase_status.info("Connecting to DMM...")
                     dmm = Multimeter(ss_cfg.dmm_visa_address)
                     dmm.configure_dc_voltage()
 
                     # Upload waveforms (once)
-                    widths = _generate_widths(
+                    widths = list(_cached_widths(
                         config.width_start, config.width_stop, config.width_step,
-                        step_zones=config.step_zones,
-                    )
+                        _zones_key(config.step_zones),
+                    ))
                     sweep_segments = len(widths)
 
+                    @_throttled_progress
                     def on_ss_upload(i: int, total: int) -> None:
                         progress.progress(
                             (i + 1) / total,
                             text=f"Uploading segments... [{i + 1}/{total}]",
                         )
 
-                    for ch in channels:
-                        instrument.setup_arbitrary(config, widths, channel=ch, callback=on_ss_upload)
+                    instrument.setup_arbitrary(config, widths, channels=channels, callback=on_ss_upload)
 
                     for ch in channels:
                         instrument.set_between_cycles_dc_zero(channel=ch)
@@ -1938,6 +2105,7 @@ with tab_sweep:
 
                         from core_step_sync import _run_step_synced_loop
 
+                        @_throttled_progress
                         def on_ss_sweep(i: int, total: int) -> None:
                             pct = (i + 1) / total
                             progress.progress(
@@ -1971,9 +2139,13 @@ with tab_sweep:
                 except Exception as exc:
                     st.error(f"Error: {exc}")
                     logger.exception("Error during step-synced sweep")
+                    # Connection state is unknown after a failure; reconnect on the next run
+                    _release_instrument(config.visa_address)
+                except BaseException:
+                    # Stopped mid-sweep (Stop / rerun): the session may be mid-transfer, so don't reuse it
+                    _release_instrument(config.visa_address)
+                    raise
                 finally:
-                    if instrument is not None:
-                        instrument.close()
                     if dmm is not None:
                         dmm.close()
 
@@ -1994,22 +2166,22 @@ with tab_isweep:
         is_col_range, is_col_timing, is_col_opts = st.columns(3)
 
         with is_col_range:
-            st.session_state.setdefault("_w_interval_pulse_width", format_si(_isw.get("pulse_width", 1e-8)))
+            _default_si("_w_interval_pulse_width", _isw.get("pulse_width", 1e-8))
             st.text_input(
                 "Pulse Width [s] (fixed)",
                 key="_w_interval_pulse_width",
             )
-            st.session_state.setdefault("_w_interval_start", format_si(_isw.get("interval_start", 1e-8)))
+            _default_si("_w_interval_start", _isw.get("interval_start", 1e-8))
             st.text_input(
                 "Interval Start [s]",
                 key="_w_interval_start",
             )
-            st.session_state.setdefault("_w_interval_stop", format_si(_isw.get("interval_stop", 5e-8)))
+            _default_si("_w_interval_stop", _isw.get("interval_stop", 5e-8))
             st.text_input(
                 "Interval Stop [s]",
                 key="_w_interval_stop",
             )
-            st.session_state.setdefault("_w_interval_step", format_si(_isw.get("interval_step", 5e-9)))
+            _default_si("_w_interval_step", _isw.get("interval_step", 5e-9))
             st.text_input(
                 "Interval Step [s]",
                 key="_w_interval_step",
@@ -2026,22 +2198,22 @@ with tab_isweep:
             if _is_var_step:
                 _isz1 = _is_szones[0] if len(_is_szones) >= 1 else [None, None]
                 _isz2 = _is_szones[1] if len(_is_szones) >= 2 else [None, None]
-                st.session_state.setdefault("_w_interval_step_zone1_boundary", format_si(_isz1[0]) if _isz1[0] is not None else "")
+                _default_si("_w_interval_step_zone1_boundary", _isz1[0])
                 _isz1_b = st.text_input(
                     "Zone 1 boundary [s]",
                     key="_w_interval_step_zone1_boundary",
                 )
-                st.session_state.setdefault("_w_interval_step_zone1_step", format_si(_isz1[1]) if _isz1[1] is not None else "")
+                _default_si("_w_interval_step_zone1_step", _isz1[1])
                 _isz1_s = st.text_input(
                     "Zone 1 step [s]",
                     key="_w_interval_step_zone1_step",
                 )
-                st.session_state.setdefault("_w_interval_step_zone2_boundary", format_si(_isz2[0]) if _isz2[0] is not None else "")
+                _default_si("_w_interval_step_zone2_boundary", _isz2[0])
                 _isz2_b = st.text_input(
                     "Zone 2 boundary [s]",
                     key="_w_interval_step_zone2_boundary",
                 )
-                st.session_state.setdefault("_w_interval_step_zone2_step", format_si(_isz2[1]) if _isz2[1] is not None else "")
+                _default_si("_w_interval_step_zone2_step", _isz2[1])
                 _isz2_s = st.text_input(
                     "Zone 2 step [s]",
                     key="_w_interval_step_zone2_step",
@@ -2058,7 +2230,7 @@ with tab_isweep:
                     _is_step_zones = None
 
         with is_col_timing:
-            st.session_state.setdefault("_w_interval_wait_time", format_si(_isw.get("wait_time", 1.0)))
+            _default_si("_w_interval_wait_time", _isw.get("wait_time", 1.0))
             st.text_input(
                 "Wait Time [s]",
                 key="_w_interval_wait_time",
@@ -2075,17 +2247,16 @@ with tab_isweep:
             )
 
         with is_col_opts:
-            st.session_state.setdefault("_w_interval_delay_mode_radio",
-                "Table" if _isw.get("delay_mode", "exponent") == "table" else "Exponent")
-            is_delay_mode = st.radio(
-                "Delay Mode", ["Exponent", "Table"], key="_w_interval_delay_mode_radio",
+            st.session_state.setdefault("_w_interval_delay_mode_radio", _delay_mode_of(_isw))
+            _is_delay_mode_val = st.radio(
+                "Delay Mode", _DELAY_MODES, format_func=str.title,
+                key="_w_interval_delay_mode_radio",
             )
-            _is_delay_mode_val = "exponent" if is_delay_mode == "Exponent" else "table"
             is_delay_exponent = 1.0
-            _is_delay_stop_val = int(trigger_delay)
+            _is_delay_stop_val = trigger_delay
 
-            if _is_delay_mode_val == "exponent":
-                st.session_state.setdefault("_w_interval_trigger_delay_stop", _isw.get("trigger_delay_stop", int(trigger_delay)))
+            if _is_delay_mode_val == _DELAY_MODE_EXPONENT:
+                st.session_state.setdefault("_w_interval_trigger_delay_stop", _isw.get("trigger_delay_stop", trigger_delay))
                 _is_delay_stop_val = st.number_input(
                     "Trigger Delay Stop [points] (×8)",
                     min_value=0, step=8,
@@ -2115,29 +2286,21 @@ with tab_isweep:
         is_parse_errors = list(common_parse_errors)
         is_parsed = dict(common_parsed)
 
-        for name, key in [
-            ("pulse_width", "_w_interval_pulse_width"),
-            ("interval_start", "_w_interval_start"),
-            ("interval_stop", "_w_interval_stop"),
-            ("interval_step", "_w_interval_step"),
-            ("wait_time", "_w_interval_wait_time"),
-        ]:
+        _state = st.session_state
+        for name, key in _INTERVAL_SWEEP_SI_FIELDS:
             try:
-                is_parsed[name] = parse_si(st.session_state.get(key, ""))
+                is_parsed[name] = parse_si(_state.get(key, ""))
             except (ValueError, KeyError):
                 is_parse_errors.append(
-                    f"{name}: invalid value \"{st.session_state.get(key, '')}\""
+                    f"{name}: invalid value \"{_state.get(key, '')}\""
                 )
 
         # Build delay_table for interval sweep
         _is_delay_table: list[tuple[float, int]] | None = None
-        if _is_delay_mode_val == "table":
+        if _is_delay_mode_val == _DELAY_MODE_TABLE:
             _pp_recs = st.session_state.get("saved_pp_records", [])
             if _pp_recs:
-                _is_delay_table = [
-                    (parse_si(r["pulse_interval"]), int(r["trigger_delay"]))
-                    for r in _pp_recs
-                ]
+                _is_delay_table = _records_table(_pp_recs, "pulse_interval")
 
         # Build config
         interval_config_built: IntervalSweepConfig | None = None
@@ -2147,15 +2310,15 @@ with tab_isweep:
                 v_on=v_on,
                 v_off=v_off,
                 frequency=is_parsed["frequency"],
-                trigger_delay=int(trigger_delay),
-                resolution_n=int(resolution_n),
+                trigger_delay=trigger_delay,
+                resolution_n=resolution_n,
                 pulse_width=is_parsed["pulse_width"],
                 interval_start=is_parsed["interval_start"],
                 interval_stop=is_parsed["interval_stop"],
                 interval_step=is_parsed["interval_step"],
                 wait_time=is_parsed["wait_time"],
                 settling_time=is_settling_time,
-                trigger_delay_stop=_is_delay_stop_val if _is_delay_stop_val != int(trigger_delay) else None,
+                trigger_delay_stop=_is_delay_stop_val if _is_delay_stop_val != trigger_delay else None,
                 delay_exponent=is_delay_exponent,
                 delay_mode=_is_delay_mode_val,
                 delay_table=_is_delay_table,
@@ -2163,26 +2326,24 @@ with tab_isweep:
             )
 
         # Validation
-        errors_isweep = list(is_parse_errors)
-        if interval_config_built is not None:
-            errors_isweep.extend(interval_config_built.validate())
+        errors_isweep = is_parse_errors if interval_config_built is None else interval_config_built.validate()
 
         if errors_isweep:
             st.error("Configuration error:\n" + "\n".join(f"- {e}" for e in errors_isweep))
         else:
             st.success("Parameters OK")
             if interval_config_built is not None:
-                intervals_preview = _generate_intervals(
+                intervals_preview = _cached_widths(
                     interval_config_built.interval_start,
                     interval_config_built.interval_stop,
                     interval_config_built.interval_step,
-                    step_zones=interval_config_built.step_zones,
+                    _zones_key(interval_config_built.step_zones),
                 )
                 try:
-                    _is_sr, _is_pts = _calc_arb_params(
+                    _is_sr, _is_pts = _cached_arb_params(
                         interval_config_built.frequency,
-                        [interval_config_built.pulse_width],
-                        intervals=intervals_preview,
+                        (interval_config_built.pulse_width,),
+                        intervals=tuple(intervals_preview),
                         resolution_n=resolution_n,
                     )
                     _is_tpp = 1.0 / interval_config_built.frequency / _is_pts
@@ -2204,29 +2365,29 @@ with tab_isweep:
             config = interval_config_built
             channels = _CHANNEL_MAP[is_channel]
             logger.info("Interval sweep started (channels=%s)", channels)
-            progress = st.progress(0, text="Connecting...")
+            status = st.status("Interval sweep", state="running", expanded=True)
+            progress = status.progress(0, text="Connecting...")
 
-            instrument = None
             try:
-                instrument = PulseInstrument(config.visa_address)
+                instrument = _get_instrument(config.visa_address)
                 progress.progress(0, text="Setting up instrument...")
 
-                intervals_list = _generate_intervals(
+                intervals_list = list(_cached_widths(
                     config.interval_start, config.interval_stop, config.interval_step,
-                    step_zones=config.step_zones,
-                )
+                    _zones_key(config.step_zones),
+                ))
 
+                @_throttled_progress
                 def on_is_upload(i: int, total: int) -> None:
                     progress.progress(
                         (i + 1) / total,
                         text=f"Uploading segments... [{i + 1}/{total}]",
                     )
 
-                for ch in channels:
-                    instrument.setup_pump_probe_arbitrary(
-                        config, config.pulse_width, intervals_list,
-                        channel=ch, callback=on_is_upload,
-                    )
+                instrument.setup_pump_probe_arbitrary(
+                    config, config.pulse_width, intervals_list,
+                    channels=channels, callback=on_is_upload,
+                )
 
                 # Set DC 0V immediately after upload (no pulses until sweep starts)
                 for ch in channels:
@@ -2234,33 +2395,13 @@ with tab_isweep:
 
                 # Settling phase
                 if config.settling_time > 0:
-                    t0 = time.time()
-                    while (elapsed := time.time() - t0) < config.settling_time:
-                        pct = elapsed / config.settling_time
-                        progress.progress(
-                            pct,
-                            text=f"Settling... {elapsed:.1f}s / {config.settling_time:.1f}s",
-                        )
-                        time.sleep(0.2)
+                    _wait_settling(progress, config.settling_time)
 
                 # Restore USER mode before sweep
                 for ch in channels:
                     instrument.restore_user_mode(config, channel=ch)
 
-                sweep_start = time.time()
-
-                def on_is_step(i: int, total: int) -> None:
-                    pct = (i + 1) / total
-                    elapsed = time.time() - sweep_start
-                    rate = (i + 1) / elapsed if elapsed > 0 else 0
-                    remaining = (total - i - 1) / rate if rate > 0 else 0
-                    progress.progress(
-                        pct,
-                        text=(
-                            f"Sweeping... {i + 1}/{total}"
-                            f" ({elapsed:.1f}s elapsed, ~{remaining:.0f}s remaining)"
-                        ),
-                    )
+                on_is_step = _sweep_progress(progress)
 
                 run_interval_sweep(config, instrument, callback=on_is_step, channels=channels)
 
@@ -2268,14 +2409,19 @@ with tab_isweep:
                     instrument.teardown(channel=ch)
 
                 progress.progress(1.0, text="Done!")
+                status.update(label="Interval sweep complete", state="complete")
                 logger.info("Interval sweep completed")
 
             except Exception as exc:
                 st.error(f"Error: {exc}")
+                status.update(label="Interval sweep failed", state="error")
                 logger.exception("Error during interval sweep")
-            finally:
-                if instrument is not None:
-                    instrument.close()
+                # Connection state is unknown after a failure; reconnect on the next run
+                _release_instrument(config.visa_address)
+            except BaseException:
+                # Stopped mid-sweep (Stop / rerun): the session may be mid-transfer, so don't reuse it
+                _release_instrument(config.visa_address)
+                raise
 
         # ============================================================ #
         #  Auto Sweep (Voltage-Triggered) for Interval Sweep
@@ -2393,32 +2539,31 @@ with tab_isweep:
                 voltage_display = st.empty()
                 progress = st.progress(0)
 
-                instrument = None
                 dmm = None
                 try:
                     phase_status.info("Connecting to AWG...")
-                    instrument = PulseInstrument(config.visa_address)
+                    instrument = _get_instrument(config.visa_address)
 
                     phase_status.info("Connecting to DMM...")
                     dmm = Multimeter(integration.dmm_visa_address)
                     dmm.configure_dc_voltage()
 
-                    intervals_list = _generate_intervals(
+                    intervals_list = list(_cached_widths(
                         config.interval_start, config.interval_stop, config.interval_step,
-                        step_zones=config.step_zones,
-                    )
+                        _zones_key(config.step_zones),
+                    ))
 
+                    @_throttled_progress
                     def on_auto_is_upload(i: int, total: int) -> None:
                         progress.progress(
                             (i + 1) / total,
                             text=f"Uploading segments... [{i + 1}/{total}]",
                         )
 
-                    for ch in channels:
-                        instrument.setup_pump_probe_arbitrary(
-                            config, config.pulse_width, intervals_list,
-                            channel=ch, callback=on_auto_is_upload,
-                        )
+                    instrument.setup_pump_probe_arbitrary(
+                        config, config.pulse_width, intervals_list,
+                        channels=channels, callback=on_auto_is_upload,
+                    )
 
                     # Set DC 0V immediately after upload (no pulses until sweep starts)
                     for ch in channels:
@@ -2426,14 +2571,7 @@ with tab_isweep:
 
                     if config.settling_time > 0:
                         phase_status.info("Settling...")
-                        t0 = time.time()
-                        while (elapsed := time.time() - t0) < config.settling_time:
-                            pct = elapsed / config.settling_time
-                            progress.progress(
-                                pct,
-                                text=f"Settling... {elapsed:.1f}s / {config.settling_time:.1f}s",
-                            )
-                            time.sleep(0.2)
+                        _wait_settling(progress, config.settling_time)
 
                     max_cycles = integration.num_cycles
                     cycle = 0
@@ -2476,32 +2614,17 @@ with tab_isweep:
                         now = time.time()
                         wait_seconds = max(0.0, prediction.sweep_start_time - now)
                         if wait_seconds > 0:
-                            t0 = time.time()
-                            while (elapsed := time.time() - t0) < wait_seconds:
-                                pct = elapsed / wait_seconds
-                                remaining = wait_seconds - elapsed
-                                progress.progress(pct, text=f"Sweep starts in {remaining:.1f}s")
-                                time.sleep(0.2)
+                            _wait_with_progress(
+                                progress, wait_seconds,
+                                lambda elapsed: f"Sweep starts in {wait_seconds - elapsed:.1f}s",
+                            )
 
                         for ch in channels:
                             instrument.restore_user_mode(config, channel=ch)
 
                         phase_status.info(f"Sweeping (cycle {label})...")
                         voltage_display.empty()
-                        sweep_start = time.time()
-
-                        def on_auto_is_step(i: int, total: int) -> None:
-                            pct = (i + 1) / total
-                            elapsed = time.time() - sweep_start
-                            rate = (i + 1) / elapsed if elapsed > 0 else 0
-                            remaining = (total - i - 1) / rate if rate > 0 else 0
-                            progress.progress(
-                                pct,
-                                text=(
-                                    f"Sweeping... {i + 1}/{total}"
-                                    f" ({elapsed:.1f}s elapsed, ~{remaining:.0f}s remaining)"
-                                ),
-                            )
+                        on_auto_is_step = _sweep_progress(progress)
 
                         run_interval_sweep(config, instrument, callback=on_auto_is_step, channels=channels)
                         logger.info("Auto interval sweep cycle %s complete", label)
@@ -2521,9 +2644,13 @@ with tab_isweep:
                 except Exception as exc:
                     st.error(f"Error: {exc}")
                     logger.exception("Error during auto interval sweep")
+                    # Connection state is unknown after a failure; reconnect on the next run
+                    _release_instrument(config.visa_address)
+                except BaseException:
+                    # Stopped mid-sweep (Stop / rerun): the session may be mid-transfer, so don't reuse it
+                    _release_instrument(config.visa_address)
+                    raise
                 finally:
-                    if instrument is not None:
-                        instrument.close()
                     if dmm is not None:
                         dmm.close()
 
@@ -2626,11 +2753,11 @@ with tab_isweep:
                 )
                 is_ss_errors = is_ss_config.validate()
 
-                n_intervals = len(_generate_intervals(
+                n_intervals = len(_cached_widths(
                     interval_config_built.interval_start,
                     interval_config_built.interval_stop,
                     interval_config_built.interval_step,
-                    step_zones=interval_config_built.step_zones,
+                    _zones_key(interval_config_built.step_zones),
                 ))
                 available = int(is_ss_total_steps) - int(is_ss_sweep_start_step)
                 if n_intervals > available:
@@ -2672,33 +2799,32 @@ with tab_isweep:
                 voltage_display = st.empty()
                 progress = st.progress(0)
 
-                instrument = None
                 dmm = None
                 try:
                     phase_status.info("Connecting to AWG...")
-                    instrument = PulseInstrument(config.visa_address)
+                    instrument = _get_instrument(config.visa_address)
 
                     phase_status.info("Connecting to DMM...")
                     dmm = Multimeter(ss_cfg.dmm_visa_address)
                     dmm.configure_dc_voltage()
 
-                    intervals_list = _generate_intervals(
+                    intervals_list = list(_cached_widths(
                         config.interval_start, config.interval_stop, config.interval_step,
-                        step_zones=config.step_zones,
-                    )
+                        _zones_key(config.step_zones),
+                    ))
                     sweep_segments = len(intervals_list)
 
+                    @_throttled_progress
                     def on_ss_is_upload(i: int, total: int) -> None:
                         progress.progress(
                             (i + 1) / total,
                             text=f"Uploading segments... [{i + 1}/{total}]",
                         )
 
-                    for ch in channels:
-                        instrument.setup_pump_probe_arbitrary(
-                            config, config.pulse_width, intervals_list,
-                            channel=ch, callback=on_ss_is_upload,
-                        )
+                    instrument.setup_pump_probe_arbitrary(
+                        config, config.pulse_width, intervals_list,
+                        channels=channels, callback=on_ss_is_upload,
+                    )
 
                     for ch in channels:
                         instrument.set_between_cycles_dc_zero(channel=ch)
@@ -2743,6 +2869,7 @@ with tab_isweep:
 
                         from core_step_sync import _run_step_synced_loop
 
+                        @_throttled_progress
                         def on_ss_is_sweep(i: int, total: int) -> None:
                             pct = (i + 1) / total
                             progress.progress(
@@ -2776,9 +2903,13 @@ with tab_isweep:
                 except Exception as exc:
                     st.error(f"Error: {exc}")
                     logger.exception("Error during step-synced interval sweep")
+                    # Connection state is unknown after a failure; reconnect on the next run
+                    _release_instrument(config.visa_address)
+                except BaseException:
+                    # Stopped mid-sweep (Stop / rerun): the session may be mid-transfer, so don't reuse it
+                    _release_instrument(config.visa_address)
+                    raise
                 finally:
-                    if instrument is not None:
-                        instrument.close()
                     if dmm is not None:
                         dmm.close()
 
@@ -2799,7 +2930,7 @@ with tab_delay:
         col_d1, col_d2, col_d3 = st.columns([2, 2, 1])
 
         with col_d1:
-            st.session_state.setdefault("_w_delay_pulse_width", format_si(_ds.get("pulse_width", 1e-8)))
+            _default_si("_w_delay_pulse_width", _ds.get("pulse_width", 1e-8))
             st.text_input(
                 "Pulse Width [s]",
                 key="_w_delay_pulse_width",
@@ -2824,7 +2955,7 @@ with tab_delay:
                 min_value=8, step=8,
                 key="_w_delay_step",
             )
-            st.session_state.setdefault("_w_delay_wait_time", format_si(_ds.get("wait_time", 1.0)))
+            _default_si("_w_delay_wait_time", _ds.get("wait_time", 1.0))
             st.text_input(
                 "Wait Time [s]",
                 key="_w_delay_wait_time",
@@ -2847,22 +2978,18 @@ with tab_delay:
         delay_parse_errors = list(common_parse_errors)
         delay_parsed = dict(common_parsed)
 
-        try:
-            delay_parsed["pulse_width"] = parse_si(st.session_state._w_delay_pulse_width)
-        except (ValueError, KeyError):
-            delay_parse_errors.append(
-                f"pulse_width: invalid value \"{st.session_state.get('_w_delay_pulse_width', '')}\""
-            )
-        try:
-            delay_parsed["wait_time"] = parse_si(st.session_state._w_delay_wait_time)
-        except (ValueError, KeyError):
-            delay_parse_errors.append(
-                f"wait_time: invalid value \"{st.session_state.get('_w_delay_wait_time', '')}\""
-            )
+        _state = st.session_state
+        for name, key in _DELAY_SWEEP_SI_FIELDS:
+            try:
+                delay_parsed[name] = parse_si(_state[key])
+            except (ValueError, KeyError):
+                delay_parse_errors.append(
+                    f"{name}: invalid value \"{_state.get(key, '')}\""
+                )
 
-        delay_start_val = st.session_state.get("_w_delay_start", 0)
-        delay_stop_val = st.session_state.get("_w_delay_stop", 80)
-        delay_step_val = st.session_state.get("_w_delay_step", 8)
+        delay_start_val = int(st.session_state.get("_w_delay_start", 0))
+        delay_stop_val = int(st.session_state.get("_w_delay_stop", 80))
+        delay_step_val = int(st.session_state.get("_w_delay_step", 8))
 
         # Build delay sweep config
         if not delay_parse_errors:
@@ -2871,21 +2998,19 @@ with tab_delay:
                 v_on=v_on,
                 v_off=v_off,
                 frequency=delay_parsed["frequency"],
-                trigger_delay=int(delay_start_val),
-                resolution_n=int(resolution_n),
+                trigger_delay=delay_start_val,
+                resolution_n=resolution_n,
                 pulse_width=delay_parsed["pulse_width"],
-                delay_start=int(delay_start_val),
-                delay_stop=int(delay_stop_val),
-                delay_step=int(delay_step_val),
+                delay_start=delay_start_val,
+                delay_stop=delay_stop_val,
+                delay_step=delay_step_val,
                 wait_time=delay_parsed["wait_time"],
                 waveform_mode=delay_waveform_mode,
                 settling_time=delay_settling_time,
             )
 
         # Validation
-        errors_delay = list(delay_parse_errors)
-        if delay_config_built is not None:
-            errors_delay.extend(delay_config_built.validate())
+        errors_delay = delay_parse_errors if delay_config_built is None else delay_config_built.validate()
 
         if errors_delay:
             st.error("Configuration error:\n" + "\n".join(f"- {e}" for e in errors_delay))
@@ -2900,43 +3025,22 @@ with tab_delay:
             config = delay_config_built
             channels = _CHANNEL_MAP[delay_channel]
             logger.info("Delay sweep started (channels=%s)", channels)
-            progress = st.progress(0, text="Connecting...")
+            status = st.status("Delay sweep", state="running", expanded=True)
+            progress = status.progress(0, text="Connecting...")
 
-            instrument = None
             try:
-                instrument = PulseInstrument(config.visa_address)
+                instrument = _get_instrument(config.visa_address)
                 progress.progress(0, text="Setting up instrument...")
 
-                for ch in channels:
-                    instrument.setup_arbitrary(
-                        config, [config.pulse_width], channel=ch,
-                    )
+                instrument.setup_arbitrary(
+                    config, [config.pulse_width], channels=channels,
+                )
 
                 # Settling phase
                 if config.settling_time > 0:
-                    t0 = time.time()
-                    while (elapsed := time.time() - t0) < config.settling_time:
-                        pct = elapsed / config.settling_time
-                        progress.progress(
-                            pct,
-                            text=f"Settling... {elapsed:.1f}s / {config.settling_time:.1f}s",
-                        )
-                        time.sleep(0.2)
+                    _wait_settling(progress, config.settling_time)
 
-                sweep_start = time.time()
-
-                def on_delay_step(i: int, total: int) -> None:
-                    pct = (i + 1) / total
-                    elapsed = time.time() - sweep_start
-                    rate = (i + 1) / elapsed if elapsed > 0 else 0
-                    remaining = (total - i - 1) / rate if rate > 0 else 0
-                    progress.progress(
-                        pct,
-                        text=(
-                            f"Sweeping... {i + 1}/{total}"
-                            f" ({elapsed:.1f}s elapsed, ~{remaining:.0f}s remaining)"
-                        ),
-                    )
+                on_delay_step = _sweep_progress(progress)
 
                 run_delay_sweep(config, instrument, callback=on_delay_step, channels=channels)
 
@@ -2944,14 +3048,19 @@ with tab_delay:
                     instrument.teardown(channel=ch)
 
                 progress.progress(1.0, text="Done!")
+                status.update(label="Delay sweep complete", state="complete")
                 logger.info("Delay sweep completed")
 
             except Exception as exc:
                 st.error(f"Error: {exc}")
+                status.update(label="Delay sweep failed", state="error")
                 logger.exception("Error during delay sweep")
-            finally:
-                if instrument is not None:
-                    instrument.close()
+                # Connection state is unknown after a failure; reconnect on the next run
+                _release_instrument(config.visa_address)
+            except BaseException:
+                # Stopped mid-sweep (Stop / rerun): the session may be mid-transfer, so don't reuse it
+                _release_instrument(config.visa_address)
+                raise
 
 
 # ================================================================== #
@@ -2969,6 +3078,13 @@ def _safe_parse_si(key: str, fallback: float) -> float:
 def _build_toml_data() -> dict:
     """Build unified TOML dict from current widget state."""
     freq = common_parsed.get("frequency", 10_000_000.0)
+    # Saved records feed both the per-mode "saved_records" and the sweep "delay_table"
+    pulse_table = [
+        [x, float(d)] for x, d in _records_table(st.session_state.get("saved_pulse_records", []), "pulse_width")
+    ]
+    pp_table = [
+        [x, float(d)] for x, d in _records_table(st.session_state.get("saved_pp_records", []), "pulse_interval")
+    ]
     data: dict = {
         "save": {
             "save_dir": st.session_state.get("_w_save_dir", _save.get("save_dir", "configs")),
@@ -2982,15 +3098,12 @@ def _build_toml_data() -> dict:
             "v_off": v_off,
             "frequency": freq,
             "period": 1.0 / freq if freq > 0 else 0.0,
-            "trigger_delay": int(trigger_delay),
-            "resolution_n": int(resolution_n),
+            "trigger_delay": trigger_delay,
+            "resolution_n": resolution_n,
         },
         "simple_pulse": {
             "pulse_width": _safe_parse_si("_w_pulse_width", _sp.get("pulse_width", 1e-8)),
-            **({"saved_records": [
-                [parse_si(r["pulse_width"]), float(r["trigger_delay"])]
-                for r in st.session_state.get("saved_pulse_records", [])
-            ]} if st.session_state.get("saved_pulse_records") else {}),
+            **({"saved_records": pulse_table} if pulse_table else {}),
         },
     }
 
@@ -3007,25 +3120,19 @@ def _build_toml_data() -> dict:
         except ValueError:
             pass
     ws_data["settling_time"] = float(st.session_state.get("_w_settling_time", _ws.get("settling_time", 0.0)))
-    _tds = int(st.session_state.get("_w_trigger_delay_stop", _ws.get("trigger_delay_stop", int(trigger_delay))))
-    if _tds != int(trigger_delay):
+    _tds = int(st.session_state.get("_w_trigger_delay_stop", _ws.get("trigger_delay_stop", trigger_delay)))
+    if _tds != trigger_delay:
         ws_data["trigger_delay_stop"] = _tds
     _de = float(st.session_state.get("_w_delay_exponent", _ws.get("delay_exponent", 1.0)))
     if _de != 1.0:
         ws_data["delay_exponent"] = _de
     # Delay mode + table
-    _dm = st.session_state.get("_w_delay_mode_radio",
-          "Table" if _ws.get("delay_mode", "exponent") == "table" else "Exponent")
-    _dm_val = "exponent" if _dm == "Exponent" else "table"
-    if _dm_val != "exponent":
+    _dm_val = st.session_state.get("_w_delay_mode_radio") or _delay_mode_of(_ws)
+    if _dm_val != _DELAY_MODE_EXPONENT:
         ws_data["delay_mode"] = _dm_val
-    if _dm_val == "table":
-        _records = st.session_state.get("saved_pulse_records", [])
-        if _records:
-            ws_data["delay_table"] = [
-                [parse_si(r["pulse_width"]), float(r["trigger_delay"])]
-                for r in _records
-            ]
+    if _dm_val == _DELAY_MODE_TABLE:
+        if pulse_table:
+            ws_data["delay_table"] = pulse_table
     # Sync mode
     _wsm = st.session_state.get("_w_sync_mode",
            "Step-Synced" if _ws.get("sync_mode", "ramp") == "step_synced" else "Ramp Detection")
@@ -3072,11 +3179,8 @@ def _build_toml_data() -> dict:
         pp_data["pulse_interval"] = parse_si(st.session_state.get("_w_pp_pulse_interval", format_si(_pp.get("pulse_interval", 2e-8))))
     except ValueError:
         pp_data["pulse_interval"] = 2e-8
-    if st.session_state.get("saved_pp_records"):
-        pp_data["saved_records"] = [
-            [parse_si(r["pulse_interval"]), float(r["trigger_delay"])]
-            for r in st.session_state.get("saved_pp_records", [])
-        ]
+    if pp_table:
+        pp_data["saved_records"] = pp_table
     data["pump_probe"] = pp_data
 
     # Interval Sweep section
@@ -3097,24 +3201,18 @@ def _build_toml_data() -> dict:
         except ValueError:
             pass
     isw_data["settling_time"] = float(st.session_state.get("_w_interval_settling_time", _isw.get("settling_time", 0.0)))
-    _is_tds = int(st.session_state.get("_w_interval_trigger_delay_stop", _isw.get("trigger_delay_stop", int(trigger_delay))))
-    if _is_tds != int(trigger_delay):
+    _is_tds = int(st.session_state.get("_w_interval_trigger_delay_stop", _isw.get("trigger_delay_stop", trigger_delay)))
+    if _is_tds != trigger_delay:
         isw_data["trigger_delay_stop"] = _is_tds
     _is_de = float(st.session_state.get("_w_interval_delay_exponent", _isw.get("delay_exponent", 1.0)))
     if _is_de != 1.0:
         isw_data["delay_exponent"] = _is_de
-    _is_dm = st.session_state.get("_w_interval_delay_mode_radio",
-             "Table" if _isw.get("delay_mode", "exponent") == "table" else "Exponent")
-    _is_dm_val = "exponent" if _is_dm == "Exponent" else "table"
-    if _is_dm_val != "exponent":
+    _is_dm_val = st.session_state.get("_w_interval_delay_mode_radio") or _delay_mode_of(_isw)
+    if _is_dm_val != _DELAY_MODE_EXPONENT:
         isw_data["delay_mode"] = _is_dm_val
-    if _is_dm_val == "table":
-        _pp_recs = st.session_state.get("saved_pp_records", [])
-        if _pp_recs:
-            isw_data["delay_table"] = [
-                [parse_si(r["pulse_interval"]), float(r["trigger_delay"])]
-                for r in _pp_recs
-            ]
+    if _is_dm_val == _DELAY_MODE_TABLE:
+        if pp_table:
+            isw_data["delay_table"] = pp_table
     # Sync mode
     _ism = st.session_state.get("_is_sync_mode",
            "Step-Synced" if _isw.get("sync_mode", "ramp") == "step_synced" else "Ramp Detection")
@@ -3174,32 +3272,40 @@ def _build_toml_data() -> dict:
 
 # Delay resolution display — fill placeholder after all tabs
 _delay_res_text = ""
+_sr_over = False
 if "frequency" in common_parsed:
     _freq = common_parsed["frequency"]
-    _res_n = int(resolution_n)
-    # Pick the best available widths for calculation
-    _arb_widths: list[float] | None = None
+    # Pick the best available widths for calculation, described by a small key
+    _arb_key: tuple | None = None
     if sweep_config_built is not None:
-        _arb_widths = _generate_widths(
+        _arb_key = (
             sweep_config_built.width_start,
             sweep_config_built.width_stop,
             sweep_config_built.width_step,
-            step_zones=sweep_config_built.step_zones,
+            _zones_key(sweep_config_built.step_zones),
         )
     elif delay_config_built is not None:
-        _arb_widths = [delay_config_built.pulse_width]
+        _arb_key = (delay_config_built.pulse_width,)
     elif pulse_config is not None:
-        _arb_widths = [pulse_config.pulse_width]
-
-    _sr_over = False
-    if _arb_widths is not None:
-        try:
-            _sr, _pts = _calc_arb_params(_freq, _arb_widths, resolution_n=_res_n)
-            _tpp = 1.0 / _freq / _pts
-            _delay_res_text = f"{format_si(8 * _tpp)}s"
-            _sr_over = _sr > MAX_SAMPLE_RATE
-        except Exception:
-            _delay_res_text = "error"
+        _arb_key = (pulse_config.pulse_width,)
+
+    if _arb_key is not None:
+        # Reuse the last result while frequency / ×n / widths are unchanged, so
+        # unrelated widget edits skip the width generation and cache lookups
+        _sig = (_freq, resolution_n, _arb_key)
+        _res_cache = st.session_state.get("_delay_res_cache")
+        if _res_cache is not None and _res_cache[0] == _sig:
+            _, _delay_res_text, _sr_over = _res_cache
+        else:
+            _arb_widths = _cached_widths(*_arb_key) if len(_arb_key) > 1 else _arb_key
+            try:
+                _sr, _pts = _cached_arb_params(_freq, _arb_widths, resolution_n=resolution_n)
+                _tpp = 1.0 / _freq / _pts
+                _delay_res_text = f"{format_si(8 * _tpp)}s"
+                _sr_over = _sr > MAX_SAMPLE_RATE
+            except Exception:
+                _delay_res_text = "error"
+            st.session_state._delay_res_cache = (_sig, _delay_res_text, _sr_over)
 
 with _delay_res_placeholder.container():
     st.text_input("Delay Resolution", value=_delay_res_text or "N/A", disabled=True)
@@ -3208,25 +3314,27 @@ with _delay_res_placeholder.container():
 
 
 # Save button — rendered in sidebar placeholder (after subheader, before expander)
-_all_parse_errors = common_parse_errors + [
-    e for e in (pulse_parse_errors or []) if e not in common_parse_errors
-] + [
-    e for e in (sweep_parse_errors or []) if e not in common_parse_errors
-] + [
-    e for e in (delay_parse_errors or []) if e not in common_parse_errors
-]
+# Only whether any tab has a parse error matters here; no need to merge the lists
+_has_parse_errors = bool(
+    common_parse_errors or pulse_parse_errors or sweep_parse_errors or delay_parse_errors
+)
 _save_dir = st.session_state.get("_w_save_dir", "").strip()
 _fn_fmt = st.session_state.get("_w_filename_format", "").strip()
 
 with _save_btn_placeholder.container():
     if st.button(
         "Save TOML", type="primary", use_container_width=True,
-        disabled=bool(_all_parse_errors) or not _save_dir or not _fn_fmt,
+        disabled=_has_parse_errors or not _save_dir or not _fn_fmt,
     ):
         try:
             toml_data = _build_toml_data()
-            path = next_save_path(_save_dir, _fn_fmt)
+            # Remember where the last save landed so the next one skips the directory scan
+            _save_hints = st.session_state.setdefault("_save_index_hint", {})
+            path = next_save_path(_save_dir, _fn_fmt, start=_save_hints.get((_save_dir, _fn_fmt), 1))
+            # Index from the file name (the format may carry a directory part), taken before writing
+            _nn = int(path.name[len(os.path.basename(_fn_fmt)):-len(".toml")])
             save_unified_toml(path, toml_data)
+            _save_hints[(_save_dir, _fn_fmt)] = _nn + 1
             st.success(f"Saved: {path.resolve()}")
             logger.info("Config saved: %s", path)
         except Exception as exc:
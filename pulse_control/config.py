@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, fields
 from logging import getLogger
 from pathlib import Path
@@ -836,7 +837,18 @@ class IntervalSweepConfig(BaseConfig):
 def load_unified_toml(path: str | Path) -> dict:
     """Load unified-format TOML. Handles period -> frequency conversion."""
     logger.info("Loading unified TOML: %s", path)
-    data = toml.load(path)
+    return _normalize_unified(toml.load(path))
+
+
+def loads_unified_toml(text: str | bytes) -> dict:
+    """Parse unified-format TOML from an in-memory string (bytes are read as UTF-8)."""
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    return _normalize_unified(toml.loads(text))
+
+
+def _normalize_unified(data: dict) -> dict:
+    """Apply period -> frequency and backward-compat conversions in place."""
     common = data.get("common", {})
     if "period" in common and "frequency" not in common:
         common["frequency"] = 1.0 / common.pop("period")
@@ -877,17 +889,42 @@ def save_unified_toml(path: str | Path, data: dict) -> None:
     logger.info("Writing unified TOML: %s", path)
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        toml.dump(data, f)
+    # Write next to the target and rename, so a failed dump never leaves a partial file
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w") as f:
+            toml.dump(data, f)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
 
+def next_save_path(save_dir: str, filename_format: str, *, start: int = 1) -> Path:
+    """Return next available path: {save_dir}/{filename_format}{nn:02d}.toml (starts at 01).
 
-def next_save_path(save_dir: str, filename_format: str) -> Path:
-    """Return next available path: {save_dir}/{filename_format}{nn:02d}.toml (starts at 01)."""
+    ``start`` > 1 is a hint (e.g. one past the last saved index): candidates are
+    then probed from there instead of listing the directory. Note that this changes
+    the numbering: with a hint, saves continue after the last index instead of
+    filling gaps from 01.
+    """
     d = Path(save_dir)
     d.mkdir(parents=True, exist_ok=True)
+    if start > 1:
+        nn = start
+        while (d / f"{filename_format}{nn:02d}.toml").exists():
+            nn += 1
+        return d / f"{filename_format}{nn:02d}.toml"
+    # List the target directory once instead of stat-ing every candidate name.
+    # filename_format may carry a directory part ("sub/run_"), and names are compared
+    # casefolded so a case-insensitive filesystem never yields an existing file.
+    head, prefix = os.path.split(filename_format)
+    parent = d / head
+    prefix_cf = prefix.casefold()
+    taken = set()
+    if parent.is_dir():
+        taken = {n for p in parent.iterdir() if (n := p.name.casefold()).startswith(prefix_cf)}
     nn = 1
-    while True:
-        p = d / f"{filename_format}{nn:02d}.toml"
-        if not p.exists():
-            return p
+    while f"{prefix}{nn:02d}.toml".casefold() in taken:
         nn += 1
+    return d / f"{filename_format}{nn:02d}.toml"
@@ -5,7 +5,7 @@ from __future__ import annotations
 import math
 import time
 from logging import getLogger
-from typing import Callable
+from typing import Callable, Sequence
 
 import numpy as np
 import pyvisa
@@ -248,20 +248,20 @@ class PulseInstrument:
         widths: list[float],
         *,
         channel: int = 1,
+        channels: Sequence[int] | None = None,
         callback: Callable[[int, int], None] | None = None,
     ) -> None:
-        """Arbitrary Waveform mode: upload all segments up front."""
-        logger.info("Starting arbitrary waveform setup (%d segments, CH%d)", len(widths), channel)
-        w = self._write
-
-        w(f":INST CH{channel}")
-        # Turn off output before reconfiguration to prevent glitches
-        w(":OUTPut OFF")
-        # Switch to USER mode first (81180A requires this before trace operations)
-        w(":FUNC:MODE USER")
-        # Clear existing segments to avoid conflicts
-        w(":TRAC:DEL:ALL")
+        """Arbitrary Waveform mode: upload all segments up front.
 
+        Pass ``channels`` to set up several channels in one call. Each channel has
+        its own segment memory, so the segments are still uploaded per channel, but
+        the waveforms are generated only once.
+        """
+        chs = tuple(channels) if channels is not None else (channel,)
+        logger.info(
+            "Starting arbitrary waveform setup (%d segments, CH%s)",
+            len(widths), ",".join(map(str, chs)),
+        )
         sample_rate, points_per_period = _calc_arb_params(
             config.frequency, widths, resolution_n=config.resolution_n,
         )
@@ -269,37 +269,16 @@ class PulseInstrument:
             "ARB params: sample_rate=%.3e Sa/s, points_per_period=%d",
             sample_rate, points_per_period,
         )
-        w(f":FREQ:RAST {sample_rate}")
 
-        # Upload waveform segment for each pulse width
+        # One waveform per pulse width
         inverted = config.v_on < config.v_off
-        for i, width in enumerate(widths):
-            seg = i + 1
-            dcycle = width * config.frequency * 100
-            waveform = _generate_pulse_waveform(
-                points_per_period, dcycle, inverted=inverted,
+        waveforms = [
+            _generate_pulse_waveform(
+                points_per_period, width * config.frequency * 100, inverted=inverted,
             )
-            w(f":TRACe:DEF {seg}, {points_per_period}")
-            w(f":TRACe:SEL {seg}")
-            # IEEE 488.2 binary block transfer (little-endian per 81180A spec)
-            self.instr.write_binary_values(":TRACe:DATA", waveform, datatype="H")
-            self._query("*OPC?")  # wait for instrument to finish processing
-            logger.debug("Uploaded segment %d: duty=%.2f%%, %d points", seg, dcycle, points_per_period)
-            if callback is not None:
-                callback(i, len(widths))
-
-        # Select first segment
-        w(":TRACe:SEL 1")
-
-        # Amplitude / offset (same calculation as square mode)
-        ampl = abs(config.v_on - config.v_off) / 2
-        offs = (config.v_on + config.v_off) / 4
-        w(f":VOLT:AMPLitude {ampl}")
-        w(f":VOLT:OFFSet {offs}")
-
-        w(f":TRIGger:DELay {config.trigger_delay}")
-        w(":OUTPut ON")
-        self._query("*OPC?")
+            for width in widths
+        ]
+        self._upload_segments(config, sample_rate, points_per_period, waveforms, chs, callback)
         logger.info("Arbitrary waveform setup complete")
 
     def setup_pump_probe_arbitrary(
@@ -309,21 +288,18 @@ class PulseInstrument:
         intervals: list[float],
         *,
         channel: int = 1,
+        channels: Sequence[int] | None = None,
         callback: Callable[[int, int], None] | None = None,
     ) -> None:
-        """Arbitrary Waveform mode for pump-probe: upload segments with varying intervals."""
+        """Arbitrary Waveform mode for pump-probe: upload segments with varying intervals.
+
+        ``channels`` works as in :meth:`setup_arbitrary`.
+        """
+        chs = tuple(channels) if channels is not None else (channel,)
         logger.info(
-            "Starting pump-probe arbitrary setup (%d segments, CH%d)",
-            len(intervals), channel,
+            "Starting pump-probe arbitrary setup (%d segments, CH%s)",
+            len(intervals), ",".join(map(str, chs)),
         )
-        w = self._write
-
-        w(f":INST CH{channel}")
-        # Turn off output before reconfiguration to prevent glitches
-        w(":OUTPut OFF")
-        w(":FUNC:MODE USER")
-        w(":TRAC:DEL:ALL")
-
         sample_rate, points_per_period = _calc_arb_params(
             config.frequency, [pulse_width],
             intervals=intervals,
@@ -333,36 +309,66 @@ class PulseInstrument:
             "ARB params: sample_rate=%.3e Sa/s, points_per_period=%d",
             sample_rate, points_per_period,
         )
-        w(f":FREQ:RAST {sample_rate}")
 
         inverted = config.v_on < config.v_off
-        for i, interval in enumerate(intervals):
-            seg = i + 1
-            waveform = _generate_pump_probe_waveform(
+        waveforms = [
+            _generate_pump_probe_waveform(
                 points_per_period, pulse_width, interval, config.frequency,
                 inverted=inverted,
             )
-            w(f":TRACe:DEF {seg}, {points_per_period}")
-            w(f":TRACe:SEL {seg}")
-            self.instr.write_binary_values(":TRACe:DATA", waveform, datatype="H")
-            self._query("*OPC?")
-            logger.debug(
-                "Uploaded segment %d: interval=%.4e s, %d points",
-                seg, interval, points_per_period,
-            )
-            if callback is not None:
-                callback(i, len(intervals))
+            for interval in intervals
+        ]
+        self._upload_segments(config, sample_rate, points_per_period, waveforms, chs, callback)
+        logger.info("Pump-probe arbitrary setup complete")
 
-        w(":TRACe:SEL 1")
+    def _upload_segments(
+        self,
+        config: BaseConfig,
+        sample_rate: float,
+        points_per_period: int,
+        waveforms: list[np.ndarray],
+        channels: Sequence[int],
+        callback: Callable[[int, int], None] | None,
+    ) -> None:
+        """Upload pre-generated segments to each channel and switch it to USER mode.
+
+        ``callback(i, total)`` counts segments over all channels.
+        """
+        w = self._write
+        n = len(waveforms)
+        total = n * len(channels)
+        # Amplitude / offset (same calculation as square mode)
         ampl = abs(config.v_on - config.v_off) / 2
         offs = (config.v_on + config.v_off) / 4
-        w(f":VOLT:AMPLitude {ampl}")
-        w(f":VOLT:OFFSet {offs}")
 
-        w(f":TRIGger:DELay {config.trigger_delay}")
-        w(":OUTPut ON")
-        self._query("*OPC?")
-        logger.info("Pump-probe arbitrary setup complete")
+        for k, channel in enumerate(channels):
+            w(f":INST CH{channel}")
+            # Turn off output before reconfiguration to prevent glitches
+            w(":OUTPut OFF")
+            # Switch to USER mode first (81180A requires this before trace operations)
+            w(":FUNC:MODE USER")
+            # Clear existing segments to avoid conflicts
+            w(":TRAC:DEL:ALL")
+            w(f":FREQ:RAST {sample_rate}")
+
+            for i, waveform in enumerate(waveforms):
+                seg = i + 1
+                w(f":TRACe:DEF {seg}, {points_per_period}")
+                w(f":TRACe:SEL {seg}")
+                # IEEE 488.2 binary block transfer (little-endian per 81180A spec)
+                self.instr.write_binary_values(":TRACe:DATA", waveform, datatype="H")
+                self._query("*OPC?")  # wait for instrument to finish processing
+                logger.debug("Uploaded segment %d (CH%d): %d points", seg, channel, points_per_period)
+                if callback is not None:
+                    callback(k * n + i, total)
+
+            # Select first segment
+            w(":TRACe:SEL 1")
+            w(f":VOLT:AMPLitude {ampl}")
+            w(f":VOLT:OFFSet {offs}")
+            w(f":TRIGger:DELay {config.trigger_delay}")
+            w(":OUTPut ON")
+            self._query("*OPC?")
 
     def select_segment(self, index: int, *, channel: int = 1) -> None:
         """Switch to a pre-uploaded segment (for arbitrary mode sweep)."""
@@ -451,7 +457,7 @@ def run_sweep(
     instrument: PulseInstrument,
     callback: Callable[[int, int], None] | None = None,
     *,
-    channels: list[int] | None = None,
+    channels: Sequence[int] | None = None,
 ) -> None:
     """Execute pulse width sweep.
 
@@ -554,7 +560,8 @@ def _generate_widths(
     """
     if not step_zones:
         n = int(round((stop - start) / step)) + 1
-        return [round(start + i * step, 10) for i in range(n)]
+        # Vectorized form of round(start + i * step, 10) (np.round agrees except at exact ties)
+        return np.round(start + np.arange(n) * step, 10).tolist()
 
     # Build zone list: [(upper_bound, zone_step), ...]
     zones = list(step_zones) + [(stop, step)]
@@ -587,7 +594,7 @@ def run_delay_sweep(
     instrument: PulseInstrument,
     callback: Callable[[int, int], None] | None = None,
     *,
-    channels: list[int] | None = None,
+    channels: Sequence[int] | None = None,
 ) -> None:
     """Execute trigger delay sweep.
 
@@ -632,7 +639,7 @@ def run_interval_sweep(
     instrument: PulseInstrument,
     callback: Callable[[int, int], None] | None = None,
     *,
-    channels: list[int] | None = None,
+    channels: Sequence[int] | None = None,
 ) -> None:
     """Execute pulse interval sweep (pump-probe mode).
 
@@ -15,7 +15,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from logging import getLogger
-from typing import Callable
+from typing import Callable, Sequence
 
 import numpy as np
 
@@ -229,7 +229,7 @@ def run_integrated_sweep(
     sweep_config: SweepConfig,
     integration_config: IntegrationConfig,
     *,
-    channels: list[int] | None = None,
+    channels: Sequence[int] | None = None,
     upload_callback: Callable[[int, int], None] | None = None,
     sweep_callback: Callable[[int, int], None] | None = None,
     ramp_callback: Callable[[float, str], None] | None = None,
@@ -263,10 +263,9 @@ def run_integrated_sweep(
             step_zones=sweep_config.step_zones,
         )
         logger.info("Uploading %d waveform segments...", len(widths))
-        for ch in channels:
-            instrument.setup_arbitrary(
-                sweep_config, widths, channel=ch, callback=upload_callback,
-            )
+        instrument.setup_arbitrary(
+            sweep_config, widths, channels=channels, callback=upload_callback,
+        )
         logger.info("Waveform upload complete.")
 
         # --- Phase 2: Cycle loop ---
@@ -328,7 +327,7 @@ def run_integrated_interval_sweep(
     interval_config: IntervalSweepConfig,
     integration_config: IntegrationConfig,
     *,
-    channels: list[int] | None = None,
+    channels: Sequence[int] | None = None,
     upload_callback: Callable[[int, int], None] | None = None,
     sweep_callback: Callable[[int, int], None] | None = None,
     ramp_callback: Callable[[float, str], None] | None = None,
@@ -352,14 +351,13 @@ def run_integrated_interval_sweep(
             step_zones=interval_config.step_zones,
         )
         logger.info("Uploading %d pump-probe segments...", len(intervals))
-        for ch in channels:
-            instrument.setup_pump_probe_arbitrary(
-                interval_config,
-                interval_config.pulse_width,
-                intervals,
-                channel=ch,
-                callback=upload_callback,
-            )
+        instrument.setup_pump_probe_arbitrary(
+            interval_config,
+            interval_config.pulse_width,
+            intervals,
+            channels=channels,
+            callback=upload_callback,
+        )
         logger.info("Waveform upload complete.")
 
         # Set DC 0V after upload (no pulses until sweep starts)
@@ -18,7 +18,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from logging import getLogger
-from typing import Callable
+from typing import Callable, Sequence
 
 import numpy as np
 
@@ -242,7 +242,7 @@ def _run_step_synced_loop(
     sweep_segments: int,
     apply_delay: Callable[[int], None],
     *,
-    channels: list[int],
+    channels: Sequence[int],
     sweep_callback: Callable[[int, int], None] | None = None,
     step_callback: Callable[[float, int, str], None] | None = None,
 ) -> None:
@@ -369,7 +369,7 @@ def _run_step_synced_loop(
 def _build_delay_applier_width(
     config: SweepConfig,
     widths: list[float],
-    channels: list[int],
+    channels: Sequence[int],
     instrument: PulseInstrument,
 ) -> Callable[[int], None]:
     """Build _apply_delay function for width sweep (same logic as run_sweep)."""
@@ -412,7 +412,7 @@ def _build_delay_applier_width(
 def _build_delay_applier_interval(
     config: IntervalSweepConfig,
     intervals: list[float],
-    channels: list[int],
+    channels: Sequence[int],
     instrument: PulseInstrument,
 ) -> Callable[[int], None]:
     """Build _apply_delay function for interval sweep (same logic as run_interval_sweep)."""
@@ -460,7 +460,7 @@ def run_step_synced_sweep(
     sweep_config: SweepConfig,
     step_sync_config: StepSyncConfig,
     *,
-    channels: list[int] | None = None,
+    channels: Sequence[int] | None = None,
     upload_callback: Callable[[int, int], None] | None = None,
     sweep_callback: Callable[[int, int], None] | None = None,
     step_callback: Callable[[float, int, str], None] | None = None,
@@ -511,10 +511,9 @@ def run_step_synced_sweep(
     try:
         # --- Upload waveforms (once) ---
         logger.info("Uploading %d waveform segments...", sweep_segments)
-        for ch in channels:
-            instrument.setup_arbitrary(
-                sweep_config, widths, channel=ch, callback=upload_callback,
-            )
+        instrument.setup_arbitrary(
+            sweep_config, widths, channels=channels, callback=upload_callback,
+        )
         logger.info("Waveform upload complete.")
 
         # Set DC 0V after upload
@@ -573,7 +572,7 @@ def run_step_synced_interval_sweep(
     interval_config: IntervalSweepConfig,
     step_sync_config: StepSyncConfig,
     *,
-    channels: list[int] | None = None,
+    channels: Sequence[int] | None = None,
     upload_callback: Callable[[int, int], None] | None = None,
     sweep_callback: Callable[[int, int], None] | None = None,
     step_callback: Callable[[float, int, str], None] | None = None,
@@ -612,14 +611,13 @@ def run_step_synced_interval_sweep(
     try:
         # --- Upload pump-probe waveforms (once) ---
         logger.info("Uploading %d pump-probe segments...", sweep_segments)
-        for ch in channels:
-            instrument.setup_pump_probe_arbitrary(
-                interval_config,
-                interval_config.pulse_width,
-                intervals,
-                channel=ch,
-                callback=upload_callback,
-            )
+        instrument.setup_pump_probe_arbitrary(
+            interval_config,
+            interval_config.pulse_width,
+            intervals,
+            channels=channels,
+            callback=upload_callback,
+        )
         logger.info("Waveform upload complete.")
 
         # Set DC 0V after upload
@@ -25,6 +25,30 @@ logger = getLogger(__name__)
 DEFAULT_CONFIG = Path("configs/config.toml")
 
 
+def _sweep_config_from_unified(data: dict) -> SweepConfig:
+    """Build a SweepConfig from the [common] and [width_sweep] sections."""
+    common = data.get("common", {})
+    ws = data.get("width_sweep", {})
+    return SweepConfig(
+        visa_address=data.get("connection", {}).get("visa_address", DEFAULT_VISA_ADDRESS),
+        v_on=common.get("v_on", 0.0),
+        v_off=common.get("v_off", -1.0),
+        frequency=common.get("frequency", 10_000_000.0),
+        trigger_delay=int(common.get("trigger_delay", 0)),
+        resolution_n=int(common.get("resolution_n", 1)),
+        width_start=ws.get("width_start", 1e-8),
+        width_stop=ws.get("width_stop", 5e-8),
+        width_step=ws.get("width_step", 5e-9),
+        wait_time=ws.get("wait_time", 1.0),
+        settling_time=ws.get("settling_time", 0.0),
+        trigger_delay_stop=ws.get("trigger_delay_stop"),
+        delay_exponent=ws.get("delay_exponent", 1.0),
+        delay_mode=ws.get("delay_mode", "exponent"),
+        delay_table=ws.get("delay_table"),
+        step_zones=ws.get("step_zones"),
+    )
+
+
 def main_pulse(config_path: str) -> None:
     """Run simple pulse mode."""
     logger.info("Config file: %s", config_path)
@@ -81,27 +105,7 @@ def main_pulse(config_path: str) -> None:
 def main_sweep(config_path: str) -> None:
     """Run pulse width sweep mode."""
     logger.info("Config file: %s", config_path)
-    data = load_unified_toml(config_path)
-    common = data.get("common", {})
-    ws = data.get("width_sweep", {})
-    config = SweepConfig(
-        visa_address=data.get("connection", {}).get("visa_address", DEFAULT_VISA_ADDRESS),
-        v_on=common.get("v_on", 0.0),
-        v_off=common.get("v_off", -1.0),
-        frequency=common.get("frequency", 10_000_000.0),
-        trigger_delay=int(common.get("trigger_delay", 0)),
-        resolution_n=int(common.get("resolution_n", 1)),
-        width_start=ws.get("width_start", 1e-8),
-        width_stop=ws.get("width_stop", 5e-8),
-        width_step=ws.get("width_step", 5e-9),
-        wait_time=ws.get("wait_time", 1.0),
-        settling_time=ws.get("settling_time", 0.0),
-        trigger_delay_stop=ws.get("trigger_delay_stop"),
-        delay_exponent=ws.get("delay_exponent", 1.0),
-        delay_mode=ws.get("delay_mode", "exponent"),
-        delay_table=ws.get("delay_table"),
-        step_zones=ws.get("step_zones"),
-    )
+    config = _sweep_config_from_unified(load_unified_toml(config_path))
 
     errors = config.validate()
     if errors:
@@ -153,28 +157,9 @@ def main_integration(config_path: str) -> None:
 
     logger.info("Config file: %s", config_path)
     data = load_unified_toml(config_path)
-    common = data.get("common", {})
-    ws = data.get("width_sweep", {})
     integ = data.get("integration", {})
 
-    sweep_config = SweepConfig(
-        visa_address=data.get("connection", {}).get("visa_address", DEFAULT_VISA_ADDRESS),
-        v_on=common.get("v_on", 0.0),
-        v_off=common.get("v_off", -1.0),
-        frequency=common.get("frequency", 10_000_000.0),
-        trigger_delay=int(common.get("trigger_delay", 0)),
-        resolution_n=int(common.get("resolution_n", 1)),
-        width_start=ws.get("width_start", 1e-8),
-        width_stop=ws.get("width_stop", 5e-8),
-        width_step=ws.get("width_step", 5e-9),
-        wait_time=ws.get("wait_time", 1.0),
-        settling_time=ws.get("settling_time", 0.0),
-        trigger_delay_stop=ws.get("trigger_delay_stop"),
-        delay_exponent=ws.get("delay_exponent", 1.0),
-        delay_mode=ws.get("delay_mode", "exponent"),
-        delay_table=ws.get("delay_table"),
-        step_zones=ws.get("step_zones"),
-    )
+    sweep_config = _sweep_config_from_unified(data)
 
     integration_config = IntegrationConfig(
         dmm_visa_address=integ.get("dmm_visa_address", "ASRL3::INSTR"),
@@ -242,28 +227,9 @@ def main_step_sync(config_path: str) -> None:
 
     logger.info("Config file: %s", config_path)
     data = load_unified_toml(config_path)
-    common = data.get("common", {})
-    ws = data.get("width_sweep", {})
     ss = data.get("step_sync", {})
 
-    sweep_config = SweepConfig(
-        visa_address=data.get("connection", {}).get("visa_address", DEFAULT_VISA_ADDRESS),
-        v_on=common.get("v_on", 0.0),
-        v_off=common.get("v_off", -1.0),
-        frequency=common.get("frequency", 10_000_000.0),
-        trigger_delay=int(common.get("trigger_delay", 0)),
-        resolution_n=int(common.get("resolution_n", 1)),
-        width_start=ws.get("width_start", 1e-8),
-        width_stop=ws.get("width_stop", 5e-8),
-        width_step=ws.get("width_step", 5e-9),
-        wait_time=ws.get("wait_time", 1.0),
-        settling_time=ws.get("settling_time", 0.0),
-        trigger_delay_stop=ws.get("trigger_delay_stop"),
-        delay_exponent=ws.get("delay_exponent", 1.0),
-        delay_mode=ws.get("delay_mode", "exponent"),
-        delay_table=ws.get("delay_table"),
-        step_zones=ws.get("step_zones"),
-    )
+    sweep_config = _sweep_config_from_unified(data)
 
     step_sync_config = StepSyncConfig(
         dmm_visa_address=ss.get("dmm_visa_address", "ASRL3::INSTR"),